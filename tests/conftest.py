@@ -8,6 +8,7 @@ inside individual tests.
 from __future__ import annotations
 
 import json
+import threading
 
 import pytest
 
@@ -25,13 +26,14 @@ def test_db(tmp_path_factory):
     original_cache = db._conn_cache
 
     db.DB_PATH = db_path
-    db._conn_cache = None
+    db._conn_cache = threading.local()
 
     yield db_path
 
     # Teardown: close connection, restore originals
-    if db._conn_cache is not None:
-        db._conn_cache.close()
+    cached = getattr(db._conn_cache, "conn", None)
+    if cached is not None:
+        cached.close()
     db._conn_cache = original_cache
     db.DB_PATH = original_path
 
@@ -1,6 +1,8 @@
 """Tests for database bootstrap — jobs domain auto-seeding."""
 import json
 
+import pytest
+
 import tools.applyops.db as db
 
 
@@ -29,6 +31,10 @@ class TestBootstrap:
         count = conn.execute("SELECT COUNT(*) FROM domains WHERE name = 'jobs'").fetchone()[0]
         assert count == 1
 
+    def test_bootstrap_records_user_version(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert version == db._BOOTSTRAP_VERSION
+
     def test_all_tables_exist(self, conn):
         tables = [r[0] for r in conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table'"
@@ -36,3 +42,20 @@ class TestBootstrap:
         for expected in ["companies", "jobs", "resumes", "applications",
                          "emails", "matches", "task_runs", "domains", "items"]:
             assert expected in tables, f"Missing table: {expected}"
+
+
+class TestSplitSchema:
+    def test_unique_index_and_comment_chunks(self):
+        stmts = db._split_schema("""
+-- leading comment only
+;
+-- Create index for lookups
+CREATE UNIQUE INDEX IF NOT EXISTS idx_u ON t(x);
+-- trailing comment
+""")
+        assert stmts == ["CREATE UNIQUE INDEX IF NOT EXISTS idx_u ON t(x)"]
+        assert db._DDL_NAME.search(stmts[0]).group(1) == "idx_u"
+
+    def test_other_statements_rejected(self):
+        with pytest.raises(ValueError, match="Not a named CREATE"):
+            db._split_schema("PRAGMA user_version = 1;")
@@ -37,6 +37,13 @@ class TestNoMatch:
         assert "no_kw_test" not in matched_names
         db.domain_remove("no_kw_test")
 
+    def test_keyword_update_is_seen(self):
+        db.domain_add(name="kw_update_test", keywords='["violin"]')
+        assert "kw_update_test" in [r["name"] for r in db.detect_domain("violin practice")]
+        db.domain_update("kw_update_test", keywords='["cello"]')
+        assert "kw_update_test" not in [r["name"] for r in db.detect_domain("violin practice")]
+        db.domain_remove("kw_update_test")
+
 
 class TestMultiDomain:
     def test_overlapping_message(self, fitness_domain):
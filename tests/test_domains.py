@@ -69,6 +69,13 @@ class TestDomainUpdate:
     def test_update_nonexistent(self):
         assert db.domain_update("zzz_nonexistent_zzz", description="x") is None
 
+    def test_partial_find_follows_rename(self):
+        db.domain_add(name="gardening_rename_test")
+        db.domain_update("gardening_rename_test", name="orchard_rename_test")
+        assert db.domain_find("gardening_rename") is None
+        assert db.domain_find("orchard_ren")["name"] == "orchard_rename_test"
+        db.domain_remove("orchard_rename_test")
+
 
 class TestDomainRemove:
     def test_remove_and_cascade(self):
@@ -1,5 +1,6 @@
 """Edge cases — weird inputs, boundaries, unicode, nested data."""
 import json
+import threading
 
 import tools.applyops.db as db
 
@@ -48,3 +49,16 @@ class TestEdgeCases:
     def test_item_list_nonexistent_domain(self):
         items = db.item_list(domain="zzz_nonexistent_zzz")
         assert items == []
+
+    def test_worker_thread_gets_own_connection(self, conn):
+        result = {}
+
+        def worker():
+            result["conn"] = db.get_conn()
+            result["domain"] = db.domain_find("jobs")
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert result["conn"] is not conn
+        assert result["domain"]["name"] == "jobs"
@@ -0,0 +1,39 @@
+"""HTML stripping and UID handling for the Gmail tool."""
+import pytest
+
+import tools.gmail as gmail
+
+HTML_SAMPLES = [
+    "<p>Fish &amp; chips &lt;3 &nbsp;x&#39;s &eacute;t&eacute;</p>",
+    "<div>before<!-- hidden note -->after</div>",
+    "<html><head><style>p { color: red }</style><script>var x = 1;</script></head>"
+    "<body><p>Hi</p>\n\n\n\n<p>there</p></body></html>",
+    " <br>line one<br>line   two ",
+    "<table><tr><td>a</td><td>b</td></tr></table><p>unclosed <b>bold",
+    "plain text",
+    "",
+]
+
+
+@pytest.mark.parametrize("html", HTML_SAMPLES)
+def test_selectolax_matches_stdlib(html, monkeypatch):
+    pytest.importorskip("selectolax")
+    assert gmail._FastHTMLParser is not None
+    fast = gmail.strip_html(html)
+    monkeypatch.setattr(gmail, "_FastHTMLParser", None)
+    assert fast == gmail.strip_html(html)
+
+
+class TestExpandSeqset:
+    def test_full_expansion(self):
+        assert gmail._expand_seqset(b"1:3,7") == [b"1", b"2", b"3", b"7"]
+
+    def test_reversed_range(self):
+        assert gmail._expand_seqset(b"5:3") == [b"3", b"4", b"5"]
+
+    def test_limit_keeps_latest(self):
+        assert gmail._expand_seqset(b"1:3,7", limit=2) == [b"3", b"7"]
+        assert gmail._expand_seqset(b"1:3,7", limit=10) == [b"1", b"2", b"3", b"7"]
+
+    def test_limit_does_not_expand_huge_ranges(self):
+        assert gmail._expand_seqset(b"1:4000000000", limit=3) == [b"3999999998", b"3999999999", b"4000000000"]
@@ -42,10 +42,28 @@ class TestItemAdd:
         assert item["data"] is None
         assert item["tags"] is None
 
+    def test_logged_under_agent(self, todos_domain):
+        item = db.item_add(domain="todos", title="From the web", agent="web")
+        entry = next(r for r in db.log_list(50) if r["entity_id"] == item["id"])
+        assert entry["agent"] == "web"
+        db.item_remove(item["id"])
+
     def test_bad_domain_raises(self):
         with pytest.raises(ValueError, match="Domain not found"):
             db.item_add(domain="nonexistent_domain", title="Should fail")
 
+    def test_add_many(self, reading_domain):
+        items = db.item_add_many("reading", [
+            {"title": "Bulk Dune", "type": "book"},
+            {"title": "Bulk Neuromancer", "tags": '["scifi"]'},
+        ])
+        assert [i["title"] for i in items] == ["Bulk Dune", "Bulk Neuromancer"]
+        assert items[0]["type"] == "book"
+        assert items[1]["type"] == "note"
+        assert [r["id"] for r in db.item_search("Neuromancer")] == [items[1]["id"]]
+        for item in items:
+            db.item_remove(item["id"])
+
 
 class TestItemGet:
     def test_get_existing(self, fitness_domain):
@@ -83,6 +101,12 @@ class TestItemList:
         priorities = [i["priority"] for i in items if i["priority"] is not None]
         assert priorities == sorted(priorities)
 
+    def test_sort_by_due_puts_undated_last(self, todos_domain):
+        items = db.item_list(domain="todos", sort="due", limit=500)
+        dated = [i["due_at"] for i in items if i["due_at"] is not None]
+        assert dated == sorted(dated)
+        assert [i["due_at"] for i in items[:len(dated)]] == dated
+
 
 class TestItemUpdate:
     def test_update_fields(self, fitness_domain):
@@ -144,6 +168,15 @@ class TestFTS5Search:
         assert len(results) >= 1
         db.item_remove(item["id"])
 
+    def test_search_follows_title_edit(self, fitness_domain):
+        item = db.item_add(domain="fitness", title="Kettlebell swing")
+        db.item_update(item["id"], status="done")
+        assert [r["id"] for r in db.item_search("Kettlebell")] == [item["id"]]
+        db.item_update(item["id"], title="Goblet squat")
+        assert db.item_search("Kettlebell") == []
+        assert [r["id"] for r in db.item_search("Goblet")] == [item["id"]]
+        db.item_remove(item["id"])
+
 
 class TestItemStats:
     def test_stats_for_domain(self, fitness_domain):
@@ -154,12 +187,29 @@ class TestItemStats:
         assert isinstance(stats["by_type"], dict)
         assert isinstance(stats["by_status"], dict)
 
+    def test_breakdowns_sum_to_total(self, fitness_domain):
+        stats = db.item_stats("fitness")
+        assert sum(stats["by_type"].values()) == stats["total"]
+        assert sum(stats["by_status"].values()) == stats["total"]
+
     def test_stats_empty_domain(self):
         dom = db.domain_add(name="stats_empty_test", description="empty")
         stats = db.item_stats("stats_empty_test")
         assert stats["total"] == 0
         db.domain_remove("stats_empty_test")
 
+    def test_counters_track_active_items(self, todos_domain):
+        before = db.get_counts("items", "active_items")
+        item = db.item_add(domain="todos", title="Counted task")
+        db.item_update(item["id"], status="done")
+        after = db.get_counts("items", "active_items")
+        assert after == {"items": before["items"] + 1, "active_items": before["active_items"]}
+        db.item_remove(item["id"])
+        assert db.get_counts("items")["items"] == before["items"]
+        assert db.get_counts("active_items")["active_items"] == (
+            db.get_conn().execute("SELECT COUNT(*) FROM items WHERE status = 'active'").fetchone()[0]
+        )
+
     def test_stats_bad_domain(self):
         with pytest.raises(ValueError):
             db.item_stats("nonexistent_domain")
@@ -1,4 +1,8 @@
 """Regression tests for existing ApplyOps (jobs pipeline) — must not break."""
+import sqlite3
+
+import pytest
+
 import tools.applyops.db as db
 
 
@@ -23,6 +27,12 @@ class TestCompanies:
         assert found is not None
         assert found["name"] == "TestCorp"
 
+    def test_add_many_reuses_existing(self):
+        existing = db.company_find("TestCorp")
+        added = db.company_add_many([{"name": "TestCorp"}, {"name": "ManyCo", "url": "https://many.co"}])
+        assert added[0]["id"] == existing["id"]
+        assert added[1]["url"] == "https://many.co"
+
 
 class TestJobs:
     def test_add_with_company(self):
@@ -42,11 +52,43 @@ class TestJobs:
         assert len(jobs) >= 1
         assert all(j["status"] == "approved" for j in jobs)
 
+    def test_list_by_company_substring(self):
+        jobs = db.job_list(company="estcor")
+        assert jobs
+        assert all(j["company_name"] == "TestCorp" for j in jobs)
+
     def test_auto_create_company(self):
         job = db.job_add(title="Designer", company="AutoCreatedCo")
         assert job["company_name"] == "AutoCreatedCo"
         assert db.company_find("AutoCreatedCo") is not None
 
+    def test_failed_add_rolls_back_auto_created_company(self):
+        with pytest.raises(sqlite3.IntegrityError):
+            db.job_add(title=None, company="RolledBackCo")
+        assert db.company_find("RolledBackCo") is None
+
+    def test_add_many(self):
+        jobs = db.job_add_many([
+            {"title": "Bulk One", "company": "TestCorp"},
+            {"title": "Bulk Two", "company": "BulkNewCo", "source": "scrape"},
+            {"title": "Bulk Three"},
+        ])
+        assert [j["title"] for j in jobs] == ["Bulk One", "Bulk Two", "Bulk Three"]
+        assert jobs[0]["company_id"] == db.company_find("TestCorp")["id"]
+        assert jobs[1]["company_id"] == db.company_find("BulkNewCo")["id"]
+        assert jobs[2]["company_id"] is None
+
+    def test_bulk_commits_together(self):
+        with pytest.raises(sqlite3.IntegrityError):
+            with db.bulk():
+                db.job_add(title="BulkKept", company="BulkTxnCo")
+                db.job_add(title=None)
+        assert db.company_find("BulkTxnCo") is None
+        with db.bulk():
+            first = db.job_add(title="BulkFirst")
+            second = db.job_add(title="BulkSecond")
+        assert db.job_get(first["id"]) and db.job_get(second["id"])
+
     def test_remove(self):
         job = db.job_add(title="ToRemove")
         assert db.job_remove(job["id"]) is True
@@ -62,6 +104,20 @@ class TestResumes:
         assert found is not None
         assert found["id"] == resume["id"]
 
+    def test_list_skips_content_by_default(self):
+        listed = {r["name"]: r for r in db.resume_list()}
+        assert "content" not in listed["test-base"]
+        full = {r["name"]: r for r in db.resume_list(columns=None)}
+        assert full["test-base"]["content"] == '{"name":"Test"}'
+
+    def test_find_many(self):
+        base = db.resume_find("test-base")
+        tailored = db.resume_add(name="Tailored-Many", content='{"name":"T"}')
+        found = db.resume_find_many([tailored["id"], "TEST-BASE", "no-such-resume"])
+        assert found[0]["id"] == tailored["id"]
+        assert found[1]["id"] == base["id"]
+        assert found[2] is None
+
 
 class TestApplications:
     def test_lifecycle(self):
@@ -74,6 +130,15 @@ class TestApplications:
         assert updated["applied_at"] is not None
         assert updated["status"] == "applied"
 
+    def test_reapply_keeps_applied_at(self):
+        job = db.job_add(title="ReapplyJob")
+        app = db.app_add(job_id=job["id"])
+        first = db.app_update(app["id"], status="applied")
+        db.app_update(app["id"], status="interviewing")
+        again = db.app_update(app["id"], status="applied")
+        assert again["applied_at"] == first["applied_at"]
+        assert db.app_update("no-such-app", status="applied") is None
+
     def test_remove(self):
         job = db.job_add(title="AppRemoveJob")
         app = db.app_add(job_id=job["id"])
@@ -93,6 +158,11 @@ class TestEmails:
         emails = db.email_list(limit=5)
         assert len(emails) >= 1
 
+    def test_body_preview_truncated(self):
+        email = db.email_add(sender="long@test.com", body="x" * 800)
+        assert email["body_preview"] == "x" * 500
+        assert db.email_add(sender="empty@test.com", body="")["body_preview"] is None
+
 
 class TestMatches:
     def test_add(self):
@@ -104,6 +174,11 @@ class TestMatches:
         )
         assert match["score"] == 85
 
+    def test_list_projection(self):
+        matches = db.match_list(min_score=80, columns=("id", "job_id", "score"))
+        assert matches
+        assert set(matches[0]) == {"id", "job_id", "score", "job_title", "company_name", "resume_name"}
+
 
 class TestStatsAndLogs:
     def test_global_stats(self):
@@ -111,6 +186,18 @@ class TestStatsAndLogs:
         assert stats["companies"] >= 1
         assert isinstance(stats["jobs_by_status"], dict)
 
+    def test_status_breakdowns_match_totals(self):
+        stats = db.get_stats()
+        assert sum(stats["jobs_by_status"].values()) == stats["jobs"]
+        assert sum(stats["apps_by_status"].values()) == stats["applications"]
+
+    def test_counts_follow_add_and_remove(self):
+        before = db.get_stats()["jobs"]
+        job = db.job_add(title="CountedJob")
+        assert db.get_stats()["jobs"] == before + 1
+        db.job_remove(job["id"])
+        assert db.get_stats()["jobs"] == before
+
     def test_log_add(self):
         log = db.log_add(agent="test", action="tested", entity_type="test", entity_id="123")
         assert log["agent"] == "test"
@@ -0,0 +1,73 @@
+"""Path validation and search for the web memory browser."""
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+import tools.applyops.routes.memory as memory
+
+
+@pytest.fixture
+def memory_dir(tmp_path, monkeypatch):
+    root = tmp_path / "memory"
+    (root / "semantic").mkdir(parents=True)
+    (tmp_path / "outside").mkdir()
+    monkeypatch.setattr(memory, "MEMORY_DIR", root)
+    return root
+
+
+class TestGetFilePath:
+    def test_plain_file_allowed(self, memory_dir):
+        assert memory._get_file_path("semantic", "note.md") == memory_dir.resolve() / "semantic" / "note.md"
+
+    def test_traversal_rejected(self, memory_dir):
+        assert memory._get_file_path("semantic", "../../x.md") is None
+        assert memory._get_file_path("..", "x.md") is None
+
+    def test_nested_path_under_symlinked_dir_rejected(self, memory_dir):
+        os.symlink(memory_dir.parent / "outside", memory_dir / "semantic" / "linked")
+        (memory_dir.parent / "outside" / "sub").mkdir()
+        assert memory._get_file_path("semantic", "linked/sub/x.md") is None
+        assert memory._get_file_path("semantic", "linked/x.md") is None
+
+    def test_symlink_inside_memory_allowed(self, memory_dir):
+        (memory_dir / "semantic" / "a.md").write_text("a")
+        os.symlink(memory_dir / "semantic" / "a.md", memory_dir / "semantic" / "b.md")
+        assert memory._get_file_path("semantic", "b.md") is not None
+
+
+class TestSearch:
+    @pytest.fixture
+    def search(self, memory_dir, monkeypatch):
+        (memory_dir / "semantic" / "accents.md").write_text("first line\nsecond Été line\nthird line\n")
+        (memory_dir / "semantic" / "under.md").write_text("snake_case name\n")
+        (memory_dir / "semantic" / "plain.md").write_text("snakeXcase name\n")
+        app = FastAPI()
+        app.include_router(memory.router, prefix="/memory")
+        client = TestClient(app)
+
+        # Capture the template context rather than rendering the page
+        rendered = {}
+        def fake_response(name, context, **kwargs):
+            rendered.update(context)
+            return HTMLResponse("")
+        monkeypatch.setattr(memory.templates, "TemplateResponse", fake_response)
+
+        def run(q):
+            assert client.get("/memory/search", params={"q": q}).status_code == 200
+            return {r["file"]: r["context"] for r in rendered["results"]}
+        return run
+
+    def test_ascii_query(self, search):
+        assert list(search("SECOND")) == ["accents.md"]
+
+    def test_non_ascii_query_is_case_insensitive(self, search):
+        results = search("été")
+        assert list(results) == ["accents.md"]
+        assert "second Été line" in results["accents.md"]
+
+    def test_wildcard_characters_match_literally(self, search):
+        assert list(search("snake_case")) == ["under.md"]
+        assert search("snake%") == {}
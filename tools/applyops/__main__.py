@@ -5,6 +5,6 @@ from pathlib import Path
 # Ensure the repo root is on sys.path so relative imports work
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from tools.applyops.cli import app
+from tools.applyops.fastpath import main
 
-app()
+main()
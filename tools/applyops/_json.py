@@ -0,0 +1,24 @@
+"""JSON encode/decode shared by the CLI and web routes, via orjson when it is installed."""
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as a fallback
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize to a str; values JSON can't represent are written with str()."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def loads(raw: str | bytes):
+    """Parse JSON; orjson's decode error subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
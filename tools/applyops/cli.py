@@ -3,13 +3,16 @@ CLI interface for ApplyOps — Typer commands for agent and human consumption.
 """
 from __future__ import annotations
 
+import functools
+import io
 import json
-from pathlib import Path
+import sys
 from typing import Optional
 
 import typer
 
-from . import db
+from . import _json, db
+from .fastpath import print_detect
 
 app = typer.Typer(help="ApplyOps — agent data store and memory CLI", no_args_is_help=True)
 log_app    = typer.Typer(help="Agent audit log", no_args_is_help=True)
@@ -17,31 +20,43 @@ flows_app  = typer.Typer(help="Manage Prefect scheduled flows", no_args_is_help=
 domain_app = typer.Typer(help="Manage domains", no_args_is_help=True)
 item_app   = typer.Typer(help="Generic item store", no_args_is_help=True)
 
-app.add_typer(log_app,    name="log")
-app.add_typer(flows_app,  name="flows")
-app.add_typer(domain_app, name="domain")
-app.add_typer(item_app,   name="item")
+_SUBAPPS = {
+    "log":    log_app,
+    "flows":  flows_app,
+    "domain": domain_app,
+    "item":   item_app,
+}
 
-# Optional private extension: job/resume/application tracking
-try:
-    from .jobs_cli import register as _register_jobs
-    _register_jobs(app)
-except ImportError:
-    pass
+for _name, _sub_app in _SUBAPPS.items():
+    app.add_typer(_sub_app, name=_name)
 
 
-def _out(data, as_json: bool = False):
+def _register_extensions(app: typer.Typer) -> None:
+    """Attach the optional private extension (job/resume/application tracking).
+
+    Not done at import time, so the built-in groups never import it; call once
+    before running or inspecting the full app.
+    """
+    try:
+        from .jobs_cli import register as _register_jobs
+        _register_jobs(app)
+    except ImportError:
+        pass
+
+
+def _out(data, as_json: bool = False, fmt=None):
+    """Print data as JSON or text. For lists, `fmt` formats each row in text mode only."""
     if as_json:
-        print(json.dumps(data, indent=2, default=str))
+        print(_json.dumps(data, indent=True))
     else:
         if isinstance(data, list):
-            for item in data:
-                print(item)
-                print()
+            # One write for the whole listing instead of two print() calls per row
+            sys.stdout.write("".join(f"{row}\n\n" for row in map(fmt or str, data)))
         else:
             print(data)
 
 
+@functools.lru_cache(maxsize=4096)
 def _date(dt_str: str | None) -> str:
     return dt_str[:10] if dt_str else "—"
 
@@ -80,7 +95,7 @@ def log_list(
     if not logs:
         print("No task runs logged.")
         return
-    _out([fmt_log(l) for l in logs] if not as_json else logs, as_json)
+    _out(logs, as_json, fmt_log)
 
 
 # --- Serve ---
@@ -97,19 +112,24 @@ def serve(
 
 # --- Domain ---
 
+def _json_join(raw: str | None) -> str | None:
+    """Comma-join a JSON array column; None when the column is unset or unparseable."""
+    if not raw:
+        return None
+    try:
+        return ", ".join(_json.loads(raw))
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
 def fmt_domain(d: dict) -> str:
-    icon = d.get("icon") or ""
-    lines = [f"[{d['id']}] {icon} {d['name']}".strip()]
-    if d.get("description"):
-        lines.append(f"  {d['description']}")
-    if d.get("keywords"):
-        try:
-            kws = json.loads(d["keywords"])
-            lines.append(f"  Keywords: {', '.join(kws)}")
-        except (json.JSONDecodeError, TypeError):
-            pass
-    lines.append(f"  Created: {_date(d['created_at'])}")
-    return "\n".join(lines)
+    keywords = _json_join(d.get("keywords"))
+    return (
+        f"[{d['id']}] {d.get('icon') or ''} {d['name']}".strip()
+        + (f"\n  {d['description']}" if d.get("description") else "")
+        + (f"\n  Keywords: {keywords}" if keywords is not None else "")
+        + f"\n  Created: {_date(d['created_at'])}"
+    )
 
 
 @domain_app.command("add")
@@ -134,11 +154,14 @@ def domain_list(
     as_json: bool = typer.Option(False, "--json", help="JSON output"),
 ):
     """List all domains."""
-    domains = db.domain_list()
+    # The text view never shows instructions or schema, which can be long
+    domains = db.domain_list(
+        None if as_json else ("id", "name", "icon", "description", "keywords", "created_at")
+    )
     if not domains:
         print("No domains found.")
         return
-    _out([fmt_domain(d) for d in domains] if not as_json else domains, as_json)
+    _out(domains, as_json, fmt_domain)
 
 
 @domain_app.command("show")
@@ -194,39 +217,23 @@ def domain_detect(
     message: str = typer.Argument(help="Message to detect domain from"),
 ):
     """Detect which domain a message belongs to."""
-    results = db.detect_domain(message)
-    if not results:
-        print("No domain matched.")
-        print("\nCreate one with: uv run applyops domain add <name> --keywords '[...]'")
-        return
-    for d in results:
-        matched = ", ".join(d.get("_matched", []))
-        print(f"  {d['name']} (score: {d['_score']}, matched: {matched})")
+    print_detect(message)
 
 
 # --- Item ---
 
 def fmt_item(i: dict) -> str:
-    domain = i.get("domain_name") or "?"
-    lines = [f"[{i['id']}] {domain}/{i['type']}: {i['title']}"]
-    lines.append(f"  Status: {i['status']}")
-    if i.get("priority") is not None:
-        lines.append(f"  Priority: {i['priority']}")
-    if i.get("due_at"):
-        lines.append(f"  Due: {i['due_at']}")
-    if i.get("tags"):
-        try:
-            tags = json.loads(i["tags"])
-            lines.append(f"  Tags: {', '.join(tags)}")
-        except (json.JSONDecodeError, TypeError):
-            pass
-    if i.get("data"):
-        preview = i["data"][:120]
-        if len(i["data"]) > 120:
-            preview += "..."
-        lines.append(f"  Data: {preview}")
-    lines.append(f"  Created: {_date(i['created_at'])}")
-    return "\n".join(lines)
+    tags = _json_join(i.get("tags"))
+    data = i.get("data")
+    return (
+        f"[{i['id']}] {i.get('domain_name') or '?'}/{i['type']}: {i['title']}\n"
+        f"  Status: {i['status']}"
+        + (f"\n  Priority: {i['priority']}" if i.get("priority") is not None else "")
+        + (f"\n  Due: {i['due_at']}" if i.get("due_at") else "")
+        + (f"\n  Tags: {tags}" if tags is not None else "")
+        + (f"\n  Data: {data[:120]}{'...' if len(data) > 120 else ''}" if data else "")
+        + f"\n  Created: {_date(i['created_at'])}"
+    )
 
 
 @item_app.command("add")
@@ -266,7 +273,7 @@ def item_list(
     if not items:
         print("No items found.")
         return
-    _out([fmt_item(i) for i in items] if not as_json else items, as_json)
+    _out(items, as_json, fmt_item)
 
 
 @item_app.command("show")
@@ -329,7 +336,7 @@ def item_search(
     if not items:
         print("No matches found.")
         return
-    _out([fmt_item(i) for i in items] if not as_json else items, as_json)
+    _out(items, as_json, fmt_item)
 
 
 @item_app.command("stats")
@@ -346,16 +353,18 @@ def item_stats(
     if as_json:
         _out(s, True)
         return
-    print(f"=== {s['domain']} ===\n")
-    print(f"Total items: {s['total']}")
+    out = io.StringIO()
+    out.write(f"=== {s['domain']} ===\n\n")
+    out.write(f"Total items: {s['total']}\n")
     if s["by_type"]:
-        print("\nBy type:")
+        out.write("\nBy type:\n")
         for t, c in s["by_type"].items():
-            print(f"  {t}: {c}")
+            out.write(f"  {t}: {c}\n")
     if s["by_status"]:
-        print("\nBy status:")
+        out.write("\nBy status:\n")
         for st, c in s["by_status"].items():
-            print(f"  {st}: {c}")
+            out.write(f"  {st}: {c}\n")
+    sys.stdout.write(out.getvalue())
 
 
 # --- Flows ---
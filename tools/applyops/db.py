@@ -7,8 +7,11 @@ Both the CLI and web UI import from this module.
 from __future__ import annotations
 
 import json
+import re
 import sqlite3
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -116,12 +119,57 @@ CREATE TABLE IF NOT EXISTS items (
     updated_at TEXT DEFAULT (datetime('now'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_items_domain ON items(domain_id);
-CREATE INDEX IF NOT EXISTS idx_items_status ON items(domain_id, status);
-CREATE INDEX IF NOT EXISTS idx_items_type ON items(domain_id, type);
+CREATE INDEX IF NOT EXISTS idx_items_domain_created ON items(domain_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_items_domain_status_created ON items(domain_id, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_items_domain_type_status ON items(domain_id, type, status);
 CREATE INDEX IF NOT EXISTS idx_items_due ON items(due_at) WHERE due_at IS NOT NULL;
+
+-- Listing indexes: filter column first, then the ORDER BY column
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_apps_created ON applications(created_at);
+CREATE INDEX IF NOT EXISTS idx_apps_status_created ON applications(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_apps_job ON applications(job_id);
+CREATE INDEX IF NOT EXISTS idx_emails_created ON emails(created_at);
+CREATE INDEX IF NOT EXISTS idx_matches_job_score ON matches(job_id, score, created_at);
+CREATE INDEX IF NOT EXISTS idx_task_runs_created ON task_runs(created_at);
+
+-- Case-insensitive name lookups in the *_find helpers
+CREATE INDEX IF NOT EXISTS idx_companies_name_lower ON companies(lower(name));
+CREATE INDEX IF NOT EXISTS idx_resumes_name_lower ON resumes(lower(name));
+CREATE INDEX IF NOT EXISTS idx_domains_name_lower ON domains(lower(name));
 """
 
+# Superseded by wider indexes with the same leading columns
+_DROPPED_INDEXES = ("idx_items_domain", "idx_items_status", "idx_items_type")
+
+_DDL_NAME = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?(?:VIRTUAL\s+)?(?:TABLE|INDEX|TRIGGER|VIEW)\s+"
+    r"(?:IF\s+NOT\s+EXISTS\s+)?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def _split_schema(script: str) -> list[str]:
+    """Split a DDL script on ';' into CREATE statements, dropping `--` comment lines.
+
+    Raises ValueError for any other statement, since _create_missing keys each
+    statement by the name _DDL_NAME extracts.
+    """
+    stmts = []
+    for chunk in script.split(";"):
+        code = "\n".join(line for line in chunk.splitlines() if not line.strip().startswith("--"))
+        code = code.strip()
+        if not code:
+            continue
+        if not _DDL_NAME.match(code):
+            raise ValueError(f"Not a named CREATE statement: {code[:60]!r}")
+        stmts.append(code)
+    return stmts
+
+
+_SCHEMA_STMTS = _split_schema(SCHEMA)
+
 # FTS5 created separately (executescript doesn't handle virtual table IF NOT EXISTS well
 # across all SQLite versions)
 _FTS_SCHEMA = """
@@ -133,21 +181,103 @@ CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
 
 # Triggers keep FTS5 in sync with the items table automatically.
 # This replaces manual FTS inserts/deletes in item_add/update/remove.
+# The update trigger only re-indexes when an indexed column actually changes,
+# so status/priority/due_at edits don't re-tokenize the item.
 _FTS_TRIGGERS = [
     """CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
         INSERT INTO items_fts(rowid, title, data, tags)
-        VALUES (new.rowid, new.title, COALESCE(new.data, ''), COALESCE(new.tags, ''));
+        VALUES (new.rowid, new.title, new.data, new.tags);
     END""",
     """CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
         INSERT INTO items_fts(items_fts, rowid, title, data, tags)
-        VALUES ('delete', old.rowid, COALESCE(old.title, ''), COALESCE(old.data, ''), COALESCE(old.tags, ''));
+        VALUES ('delete', old.rowid, old.title, old.data, old.tags);
     END""",
-    """CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE ON items BEGIN
+    """CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE OF title, data, tags ON items
+    WHEN old.title IS NOT new.title OR old.data IS NOT new.data OR old.tags IS NOT new.tags
+    BEGIN
         INSERT INTO items_fts(items_fts, rowid, title, data, tags)
-        VALUES ('delete', old.rowid, COALESCE(old.title, ''), COALESCE(old.data, ''), COALESCE(old.tags, ''));
+        VALUES ('delete', old.rowid, old.title, old.data, old.tags);
         INSERT INTO items_fts(rowid, title, data, tags)
-        VALUES (new.rowid, new.title, COALESCE(new.data, ''), COALESCE(new.tags, ''));
+        VALUES (new.rowid, new.title, new.data, new.tags);
+    END""",
+]
+
+# Trigram indexes back the case-insensitive substring matches on these
+# (table, column) pairs: the *_find fallbacks and job_list's company filter
+# (needs the FTS5 trigram tokenizer, SQLite 3.34+).
+_NAME_FTS_COLUMNS = (
+    ("companies", "name"), ("resumes", "name"), ("domains", "name"), ("jobs", "company_name"),
+)
+
+_NAME_FTS_TRIGGERS = [
+    stmt
+    for t, c in _NAME_FTS_COLUMNS
+    for stmt in (
+        f"""CREATE TRIGGER IF NOT EXISTS {t}_{c}_fts_insert AFTER INSERT ON {t} BEGIN
+        INSERT INTO {t}_{c}_fts(rowid, {c}) VALUES (new.rowid, new.{c});
     END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {t}_{c}_fts_delete AFTER DELETE ON {t} BEGIN
+        INSERT INTO {t}_{c}_fts({t}_{c}_fts, rowid, {c}) VALUES ('delete', old.rowid, old.{c});
+    END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {t}_{c}_fts_update AFTER UPDATE OF {c} ON {t} BEGIN
+        INSERT INTO {t}_{c}_fts({t}_{c}_fts, rowid, {c}) VALUES ('delete', old.rowid, old.{c});
+        INSERT INTO {t}_{c}_fts(rowid, {c}) VALUES (new.rowid, new.{c});
+    END""",
+    )
+]
+
+# Row counts kept current by triggers instead of COUNT(*) scans:
+# row_counts key -> (table, optional row condition with {row} for new/old).
+_COUNTERS: dict[str, tuple[str, str | None]] = {
+    "companies": ("companies", None),
+    "jobs": ("jobs", None),
+    "resumes": ("resumes", None),
+    "applications": ("applications", None),
+    "emails": ("emails", None),
+    "matches": ("matches", None),
+    "domains": ("domains", None),
+    "items": ("items", None),
+    "active_items": ("items", "{row}.status = 'active'"),
+}
+
+# The tables get_stats reports on
+_STATS_TABLES = ("companies", "jobs", "resumes", "applications", "emails", "matches")
+
+_COUNTER_SCHEMA = """CREATE TABLE IF NOT EXISTS row_counts (
+    tbl TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+)"""
+
+
+def _counter_triggers(key: str, table: str, cond: str | None) -> list[str]:
+    if cond is None:
+        return [
+            f"""CREATE TRIGGER IF NOT EXISTS {key}_count_insert AFTER INSERT ON {table} BEGIN
+        UPDATE row_counts SET n = n + 1 WHERE tbl = '{key}';
+    END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {key}_count_delete AFTER DELETE ON {table} BEGIN
+        UPDATE row_counts SET n = n - 1 WHERE tbl = '{key}';
+    END""",
+        ]
+    new, old = cond.format(row="new"), cond.format(row="old")
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS {key}_count_insert AFTER INSERT ON {table}
+    WHEN {new} BEGIN
+        UPDATE row_counts SET n = n + 1 WHERE tbl = '{key}';
+    END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {key}_count_delete AFTER DELETE ON {table}
+    WHEN {old} BEGIN
+        UPDATE row_counts SET n = n - 1 WHERE tbl = '{key}';
+    END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {key}_count_update AFTER UPDATE ON {table}
+    WHEN ({new}) IS NOT ({old}) BEGIN
+        UPDATE row_counts SET n = n + coalesce({new}, 0) - coalesce({old}, 0) WHERE tbl = '{key}';
+    END""",
+    ]
+
+
+_COUNTER_TRIGGERS = [
+    stmt for key, (table, cond) in _COUNTERS.items() for stmt in _counter_triggers(key, table, cond)
 ]
 
 # Instructions bootstrapped into the "jobs" domain so agents can load them dynamically
@@ -220,56 +350,224 @@ uv run applyops log list [--limit 20] [--json]
 """
 
 
-_conn_cache: sqlite3.Connection | None = None
+# One long-lived connection per thread (the web server calls in from worker
+# threads); schema setup runs once per process under _schema_lock.
+_conn_cache = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready_for: Path | None = None
+_name_fts_ready = False  # trigram indexes usable on the current DB_PATH
 
 
 def get_conn() -> sqlite3.Connection:
-    """Get the cached connection to the SQLite database, creating schema on first call."""
-    global _conn_cache
-    if _conn_cache is not None:
-        return _conn_cache
+    """Get this thread's cached connection to the SQLite database, creating schema on first use."""
+    try:
+        return _conn_cache.conn
+    except AttributeError:
+        pass
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    # Autocommit mode: writes open their own transaction via _txn
+    conn = sqlite3.connect(
+        str(DB_PATH), check_same_thread=False, isolation_level=None, cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA busy_timeout=5000")
-    conn.executescript(SCHEMA)
-    # FTS5 virtual table + auto-sync triggers
-    try:
-        conn.executescript(_FTS_SCHEMA)
-        for trigger in _FTS_TRIGGERS:
-            conn.execute(trigger)
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass  # FTS5 not available on this SQLite build
-    _bootstrap(conn)
-    _conn_cache = conn
+    # WAL + NORMAL only fsyncs at checkpoints, not on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    _ensure_schema(conn)
+    _conn_cache.conn = conn
     return conn
 
 
+def _ensure_schema(conn: sqlite3.Connection):
+    """Create tables, FTS and seed data once per process for the current DB_PATH."""
+    global _schema_ready_for, _name_fts_ready
+    with _schema_lock:
+        if _schema_ready_for == DB_PATH:
+            return
+        # One catalog read; on an up-to-date database no DDL is prepared at all
+        existing = dict(conn.execute("SELECT name, sql FROM sqlite_master").fetchall())
+        _create_missing(conn, existing, _SCHEMA_STMTS)
+        for name in _DROPPED_INDEXES:
+            if name in existing:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+                del existing[name]
+        # FTS5 virtual table + auto-sync triggers
+        try:
+            if "items_fts" not in existing:
+                conn.executescript(_FTS_SCHEMA)
+            # Replace the older update trigger that fired on every column
+            if "UPDATE OF" not in existing.get("items_fts_update", "UPDATE OF"):
+                conn.execute("DROP TRIGGER items_fts_update")
+                del existing["items_fts_update"]
+            _create_missing(conn, existing, _FTS_TRIGGERS)
+        except sqlite3.OperationalError:
+            pass  # FTS5 not available on this SQLite build
+        try:
+            _ensure_name_fts(conn, existing)
+            _name_fts_ready = True
+        except sqlite3.OperationalError:
+            _name_fts_ready = False  # No trigram tokenizer: keep plain LIKE scans
+        _ensure_counters(conn, existing)
+        _bootstrap(conn)
+        _schema_ready_for = DB_PATH
+
+
+def _create_missing(conn: sqlite3.Connection, existing: dict[str, str], stmts: list[str]):
+    """Run the CREATE statements whose object isn't in `existing` (name -> sql) yet."""
+    missing = [stmt for stmt in stmts if _DDL_NAME.search(stmt).group(1) not in existing]
+    if not missing:
+        return
+    with _txn(conn):
+        for stmt in missing:
+            conn.execute(stmt)
+    existing.update((_DDL_NAME.search(stmt).group(1), stmt) for stmt in missing)
+
+
+def _ensure_name_fts(conn: sqlite3.Connection, existing: dict[str, str]):
+    """Create the trigram name indexes, building each from its table the first time."""
+    missing = [(t, c) for t, c in _NAME_FTS_COLUMNS if f"{t}_{c}_fts" not in existing]
+    if not missing and all(_DDL_NAME.search(t).group(1) in existing for t in _NAME_FTS_TRIGGERS):
+        return
+    with _txn(conn):
+        for t, c in missing:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {t}_{c}_fts USING fts5("
+                f"{c}, content={t}, content_rowid=rowid, tokenize='trigram')"
+            )
+            conn.execute(f"INSERT INTO {t}_{c}_fts({t}_{c}_fts) VALUES ('rebuild')")
+        _create_missing(conn, existing, _NAME_FTS_TRIGGERS)
+
+
+def _ensure_counters(conn: sqlite3.Connection, existing: dict[str, str]):
+    """Create the row_counts triggers, seeding each count from the table the first time."""
+    if all(_DDL_NAME.search(t).group(1) in existing for t in _COUNTER_TRIGGERS):
+        return
+    with _txn(conn):
+        _create_missing(conn, existing, [_COUNTER_SCHEMA])
+        for key, (table, cond) in _COUNTERS.items():
+            where = f" WHERE {cond.format(row=table)}" if cond else ""
+            conn.execute(
+                f"INSERT OR IGNORE INTO row_counts (tbl, n) "
+                f"SELECT '{key}', COUNT(*) FROM {table}{where}"
+            )
+        _create_missing(conn, existing, _COUNTER_TRIGGERS)
+
+
+_JOBS_KEYWORDS = ("job", "jobs", "application", "resume", "company", "recruiter",
+                  "hiring", "interview", "offer", "salary", "compensation")
+
+# Bumped when _bootstrap gains new seed data; stored in PRAGMA user_version.
+_BOOTSTRAP_VERSION = 1
+
+
 def _bootstrap(conn: sqlite3.Connection):
     """Seed built-in domains if not present."""
-    row = conn.execute("SELECT id FROM domains WHERE name = 'jobs'").fetchone()
-    if not row:
-        conn.execute(
-            "INSERT INTO domains (name, description, instructions, keywords, icon) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (
-                "jobs",
-                "Job application tracking — companies, jobs, resumes, applications, emails",
-                _JOBS_INSTRUCTIONS,
-                json.dumps(["job", "jobs", "application", "resume", "company",
-                            "recruiter", "hiring", "interview", "offer", "salary",
-                            "compensation"]),
-                "briefcase",
-            ),
-        )
-        conn.commit()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _BOOTSTRAP_VERSION:
+        return
+    with _txn(conn):
+        row = conn.execute("SELECT id FROM domains WHERE name = 'jobs'").fetchone()
+        if not row:
+            # json_array builds the keywords JSON inside SQLite
+            conn.execute(
+                "INSERT INTO domains (name, description, instructions, keywords, icon) "
+                f"VALUES (?, ?, ?, json_array({', '.join('?' * len(_JOBS_KEYWORDS))}), ?)",
+                (
+                    "jobs",
+                    "Job application tracking — companies, jobs, resumes, applications, emails",
+                    _JOBS_INSTRUCTIONS,
+                    *_JOBS_KEYWORDS,
+                    "briefcase",
+                ),
+            )
+        conn.execute(f"PRAGMA user_version = {_BOOTSTRAP_VERSION}")
+
+
+@contextmanager
+def _txn(conn: sqlite3.Connection):
+    """Run the enclosed writes as one transaction, joining one that is already open.
+
+    BEGIN IMMEDIATE takes the write lock up front, and a row plus its task_runs
+    entry commit or roll back together.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+@contextmanager
+def bulk():
+    """Run several API calls (job_add, match_add, ...) as one transaction.
+
+    Each call's own _txn joins the open transaction, so a loop inside
+    `with bulk():` commits once and rolls back as a whole on error.
+    """
+    conn = get_conn()
+    with _txn(conn):
+        yield conn
+
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _insert(conn: sqlite3.Connection, table: str, values: dict[str, Any],
+            exprs: dict[str, str] | None = None) -> sqlite3.Row:
+    """INSERT one row and return it, in a single statement when RETURNING is available.
+
+    exprs optionally wraps a column's placeholder in SQL, e.g. {"col": "trim(?)"}.
+    """
+    exprs = exprs or {}
+    sql = (f"INSERT INTO {table} ({', '.join(values)}) "
+           f"VALUES ({', '.join(exprs.get(col, '?') for col in values)})")
+    params = tuple(values.values())
+    if _HAS_RETURNING:
+        return conn.execute(sql + " RETURNING *", params).fetchone()
+    cur = conn.execute(sql, params)
+    return conn.execute(f"SELECT * FROM {table} WHERE rowid = ?", (cur.lastrowid,)).fetchone()
+
+
+def _insert_many(conn: sqlite3.Connection, table: str, columns: tuple[str, ...],
+                 params: list[tuple]) -> list[sqlite3.Row]:
+    """INSERT many rows with one executemany and return them in input order.
+
+    Call inside _txn: new rowids land past the current max while the write
+    lock is held, which is how the rows are read back.
+    """
+    last = conn.execute(f"SELECT coalesce(max(rowid), 0) FROM {table}").fetchone()[0]
+    conn.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+        params,
+    )
+    return conn.execute(f"SELECT * FROM {table} WHERE rowid > ? ORDER BY rowid", (last,)).fetchall()
 
 
-def _now() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+@lru_cache(maxsize=128)
+def _update_sql(table: str, cols: tuple[str, ...],
+                stamped: tuple[str, ...] = ("updated_at",),
+                exprs: tuple[tuple[str, str], ...] = (), returning: bool = False) -> str:
+    """UPDATE by id setting `cols` from parameters and `stamped` to the current time.
+
+    `exprs` are extra (column, SQL expression) assignments whose placeholders
+    follow the cols parameters. Callers pass cols sorted so each update shape
+    maps to one SQL string, which keeps sqlite3's statement cache effective.
+    With `returning` (and SQLite 3.35+) the statement also yields the updated row.
+    """
+    assignments = ([f"{c} = ?" for c in cols] + [f"{c} = {e}" for c, e in exprs]
+                   + [f"{c} = datetime('now')" for c in stamped])
+    sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE id = ?"
+    return sql + " RETURNING *" if returning and _HAS_RETURNING else sql
 
 
 def _log_action(conn: sqlite3.Connection, agent: str, action: str,
@@ -281,51 +579,111 @@ def _log_action(conn: sqlite3.Connection, agent: str, action: str,
     )
 
 
+def _log_action_many(conn: sqlite3.Connection, agent: str,
+                     entries: list[tuple[str, str, str]]):
+    """Log several (action, entity_type, entity_id) entries in one executemany."""
+    conn.executemany(
+        "INSERT INTO task_runs (agent, action, entity_type, entity_id) VALUES (?, ?, ?, ?)",
+        [(agent, *entry) for entry in entries],
+    )
+
+
+def _columns(columns: tuple[str, ...] | None, alias: str | None = None) -> str:
+    """SELECT list for an optional column projection (None means every column).
+
+    With `alias` the columns are qualified, for queries that join other tables.
+    """
+    prefix = f"{alias}." if alias else ""
+    if columns is None:
+        return f"{prefix}*"
+    if not all(c.isidentifier() for c in columns):
+        raise ValueError(f"Invalid column list: {columns!r}")
+    return ", ".join(prefix + c for c in columns)
+
+
 # --- Companies ---
 
 def company_add(name: str, url: str | None = None,
                 description: str | None = None) -> dict:
     conn = get_conn()
-    try:
-        cur = conn.execute(
-            "INSERT INTO companies (name, url, description) VALUES (?, ?, ?)",
-            (name, url, description),
-        )
-    except sqlite3.IntegrityError:
-        # Already exists — return existing record
-        existing = company_find(name)
-        if existing:
-            return existing
-        raise
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM companies WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added company", "company", row["id"])
-    conn.commit()
+    with _txn(conn):
+        try:
+            row = _insert(conn, "companies",
+                          {"name": name, "url": url, "description": description})
+        except sqlite3.IntegrityError:
+            # Already exists — return existing record
+            existing = company_find(name)
+            if existing:
+                return existing
+            raise
+        _log_action(conn, "cli", "added company", "company", row["id"])
     return dict(row)
 
 
-def company_list() -> list[dict]:
+def company_add_many(companies: list[dict[str, Any]]) -> list[dict]:
+    """Add several companies in one transaction, in input order.
+
+    Each dict takes company_add's arguments (name required). As with
+    company_add, names that already exist return the existing record.
+    """
+    if not companies:
+        return []
     conn = get_conn()
-    rows = conn.execute("SELECT * FROM companies ORDER BY created_at DESC").fetchall()
-    return [dict(r) for r in rows]
+    with _txn(conn):
+        names = list(dict.fromkeys(c["name"] for c in companies))
+        by_name = {
+            r["name"]: dict(r) for r in conn.execute(
+                f"SELECT * FROM companies WHERE name IN ({', '.join('?' * len(names))})", names
+            )
+        }
+        new = {c["name"]: c for c in companies if c["name"] not in by_name}
+        rows = _insert_many(conn, "companies", ("name", "url", "description"), [
+            (c["name"], c.get("url"), c.get("description")) for c in new.values()
+        ])
+        _log_action_many(conn, "cli", [("added company", "company", r["id"]) for r in rows])
+        by_name.update((r["name"], dict(r)) for r in rows)
+    return [by_name[c["name"]] for c in companies]
+
+
+def company_list(columns: tuple[str, ...] | None = None) -> list[dict]:
+    conn = get_conn()
+    return [dict(r) for r in conn.execute(
+        f"SELECT {_columns(columns)} FROM companies ORDER BY created_at DESC"
+    )]
+
+
+def _find_exact(conn: sqlite3.Connection, table: str, name_or_id: str) -> sqlite3.Row | None:
+    """Match by ID, else case-insensitive name, in one indexed lookup."""
+    return conn.execute(
+        f"SELECT * FROM {table} WHERE id = ?1 OR lower(name) = lower(?1) "
+        "ORDER BY id = ?1 DESC LIMIT 1",
+        (name_or_id,),
+    ).fetchone()
+
+
+def _contains(table: str, column: str) -> str:
+    """WHERE fragment: lower(column) LIKE ?, served by the trigram index when present."""
+    if _name_fts_ready:
+        return f"{table}.rowid IN (SELECT rowid FROM {table}_{column}_fts WHERE {column} LIKE ?)"
+    return f"lower({table}.{column}) LIKE ?"
+
+
+def _find_fuzzy(conn: sqlite3.Connection, table: str, name_or_id: str) -> sqlite3.Row | None:
+    """First row (in table order) whose name contains name_or_id, case-insensitively."""
+    return conn.execute(
+        f"SELECT * FROM {table} WHERE {_contains(table, 'name')} ORDER BY rowid LIMIT 1",
+        (f"%{name_or_id.lower()}%",),
+    ).fetchone()
 
 
 def company_find(name_or_id: str) -> dict | None:
     """Find a company by exact ID or case-insensitive name match."""
     conn = get_conn()
-    row = conn.execute("SELECT * FROM companies WHERE id = ?", (name_or_id,)).fetchone()
+    row = _find_exact(conn, "companies", name_or_id)
     if row:
         return dict(row)
-    row = conn.execute(
-        "SELECT * FROM companies WHERE lower(name) = lower(?)", (name_or_id,)
-    ).fetchone()
-    if row:
-        return dict(row)
-    # Fuzzy: LIKE
-    row = conn.execute(
-        "SELECT * FROM companies WHERE lower(name) LIKE ?",
-        (f"%{name_or_id.lower()}%",),
-    ).fetchone()
+    # Fuzzy: substring match
+    row = _find_fuzzy(conn, "companies", name_or_id)
     return dict(row) if row else None
 
 
@@ -334,7 +692,7 @@ def company_find(name_or_id: str) -> dict | None:
 def job_add(title: str, company: str | None = None, url: str | None = None,
             source: str | None = None, description: str | None = None) -> dict:
     conn = get_conn()
-    try:
+    with _txn(conn):
         company_id = None
         company_name = company
         if company:
@@ -343,39 +701,61 @@ def job_add(title: str, company: str | None = None, url: str | None = None,
                 company_id = co["id"]
                 company_name = co["name"]
             else:
-                # Auto-create company (idempotent)
+                # Auto-create company (idempotent, joins this transaction)
                 co = company_add(company)
                 company_id = co["id"]
                 company_name = co["name"]
 
-        cur = conn.execute(
-            "INSERT INTO jobs (title, company_id, company_name, url, source, description) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (title, company_id, company_name, url, source, description),
-        )
-        row_id = cur.lastrowid
-        row = conn.execute("SELECT * FROM jobs WHERE rowid = ?", (row_id,)).fetchone()
+        row = _insert(conn, "jobs", {
+            "title": title, "company_id": company_id, "company_name": company_name,
+            "url": url, "source": source, "description": description,
+        })
         _log_action(conn, "cli", "added job", "job", row["id"])
-        conn.commit()
-        return dict(row)
-    except Exception:
-        conn.rollback()
-        raise
+    return dict(row)
+
+
+def job_add_many(jobs: list[dict[str, Any]]) -> list[dict]:
+    """Add several jobs in one transaction, in input order.
+
+    Each dict takes job_add's arguments (title required). Companies are
+    resolved or auto-created once per distinct name.
+    """
+    if not jobs:
+        return []
+    conn = get_conn()
+    with _txn(conn):
+        companies = {}
+        for name in dict.fromkeys(j["company"] for j in jobs if j.get("company")):
+            companies[name] = company_find(name) or company_add(name)
+        params = []
+        for j in jobs:
+            co = companies.get(j.get("company"))
+            params.append((
+                j["title"], co["id"] if co else None, co["name"] if co else j.get("company"),
+                j.get("url"), j.get("source"), j.get("description"),
+            ))
+        rows = _insert_many(
+            conn, "jobs",
+            ("title", "company_id", "company_name", "url", "source", "description"),
+            params,
+        )
+        _log_action_many(conn, "cli", [("added job", "job", r["id"]) for r in rows])
+    return [dict(r) for r in rows]
 
 
-def job_list(status: str | None = None, company: str | None = None) -> list[dict]:
+def job_list(status: str | None = None, company: str | None = None,
+             columns: tuple[str, ...] | None = None) -> list[dict]:
     conn = get_conn()
-    query = "SELECT * FROM jobs WHERE 1=1"
+    query = f"SELECT {_columns(columns)} FROM jobs WHERE 1=1"
     params: list[Any] = []
     if status:
         query += " AND status = ?"
         params.append(status)
     if company:
-        query += " AND lower(company_name) LIKE ?"
+        query += f" AND {_contains('jobs', 'company_name')}"
         params.append(f"%{company.lower()}%")
     query += " ORDER BY created_at DESC"
-    rows = conn.execute(query, params).fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(query, params)]
 
 
 def job_get(job_id: str) -> dict | None:
@@ -393,13 +773,12 @@ def job_update(job_id: str, **kwargs) -> dict | None:
     updates = {k: v for k, v in kwargs.items() if k in allowed and v is not None}
     if not updates:
         return dict(row)
-    updates["updated_at"] = _now()
-    set_clause = ", ".join(f"{k} = ?" for k in updates)
-    vals = list(updates.values()) + [job_id]
-    conn.execute(f"UPDATE jobs SET {set_clause} WHERE id = ?", vals)
-    _log_action(conn, "cli", f"updated job ({', '.join(updates.keys())})", "job", job_id)
-    conn.commit()
-    return job_get(job_id)
+    cols = tuple(sorted(updates))
+    vals = [updates[k] for k in cols] + [job_id]
+    with _txn(conn):
+        updated = conn.execute(_update_sql("jobs", cols, returning=True), vals).fetchone()
+        _log_action(conn, "cli", f"updated job ({', '.join([*updates, 'updated_at'])})", "job", job_id)
+    return dict(updated) if updated is not None else job_get(job_id)
 
 
 def job_remove(job_id: str) -> bool:
@@ -407,9 +786,9 @@ def job_remove(job_id: str) -> bool:
     row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
     if not row:
         return False
-    conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-    _log_action(conn, "cli", "removed job", "job", job_id)
-    conn.commit()
+    with _txn(conn):
+        conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        _log_action(conn, "cli", "removed job", "job", job_id)
     return True
 
 
@@ -418,66 +797,85 @@ def job_remove(job_id: str) -> bool:
 def resume_add(name: str, content: str,
                tailored_for_job_id: str | None = None) -> dict:
     conn = get_conn()
-    cur = conn.execute(
-        "INSERT INTO resumes (name, content, tailored_for_job_id) VALUES (?, ?, ?)",
-        (name, content, tailored_for_job_id),
-    )
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM resumes WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added resume", "resume", row["id"])
-    conn.commit()
+    with _txn(conn):
+        row = _insert(conn, "resumes", {
+            "name": name, "content": content, "tailored_for_job_id": tailored_for_job_id,
+        })
+        _log_action(conn, "cli", "added resume", "resume", row["id"])
     return dict(row)
 
 
-def resume_list() -> list[dict]:
+# Everything but the (potentially large) content body
+RESUME_LIST_COLUMNS = ("id", "name", "tailored_for_job_id", "pdf_path", "created_at")
+
+
+def resume_list(columns: tuple[str, ...] | None = RESUME_LIST_COLUMNS) -> list[dict]:
+    """List resumes, newest first. Pass columns=None to include content."""
     conn = get_conn()
-    rows = conn.execute("SELECT * FROM resumes ORDER BY created_at DESC").fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(
+        f"SELECT {_columns(columns)} FROM resumes ORDER BY created_at DESC"
+    )]
 
 
 def resume_set_pdf(resume_id: str, pdf_path: str) -> None:
     """Store the rendered PDF path for a resume."""
     conn = get_conn()
-    conn.execute("UPDATE resumes SET pdf_path = ? WHERE id = ?", (pdf_path, resume_id))
-    conn.commit()
+    with _txn(conn):
+        conn.execute("UPDATE resumes SET pdf_path = ? WHERE id = ?", (pdf_path, resume_id))
 
 
 def resume_find(name_or_id: str) -> dict | None:
     conn = get_conn()
-    row = conn.execute("SELECT * FROM resumes WHERE id = ?", (name_or_id,)).fetchone()
-    if row:
-        return dict(row)
-    row = conn.execute(
-        "SELECT * FROM resumes WHERE lower(name) = lower(?)", (name_or_id,)
-    ).fetchone()
+    row = _find_exact(conn, "resumes", name_or_id)
     if row:
         return dict(row)
-    row = conn.execute(
-        "SELECT * FROM resumes WHERE lower(name) LIKE ?",
-        (f"%{name_or_id.lower()}%",),
-    ).fetchone()
+    row = _find_fuzzy(conn, "resumes", name_or_id)
     return dict(row) if row else None
 
 
+def resume_find_many(names_or_ids: list[str]) -> list[dict | None]:
+    """Resolve several resumes at once, in input order (None where not found).
+
+    Exact ID and case-insensitive name matches come back from a single query;
+    only keys that miss both fall back to resume_find's fuzzy match.
+    """
+    if not names_or_ids:
+        return []
+    conn = get_conn()
+    id_marks = ", ".join(["?"] * len(names_or_ids))
+    name_marks = ", ".join(["lower(?)"] * len(names_or_ids))
+    rows = conn.execute(
+        f"SELECT * FROM resumes WHERE id IN ({id_marks}) OR lower(name) IN ({name_marks})",
+        [*names_or_ids, *names_or_ids],
+    ).fetchall()
+    by_id: dict[str, dict] = {}
+    by_name: dict[str, dict] = {}
+    for r in rows:
+        r = dict(r)
+        by_id[r["id"]] = r
+        by_name.setdefault(r["name"].lower(), r)
+    return [
+        by_id.get(key) or by_name.get(key.lower()) or resume_find(key)
+        for key in names_or_ids
+    ]
+
+
 # --- Applications ---
 
 def app_add(job_id: str, resume_id: str | None = None) -> dict:
     conn = get_conn()
-    cur = conn.execute(
-        "INSERT INTO applications (job_id, resume_id) VALUES (?, ?)",
-        (job_id, resume_id),
-    )
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM applications WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added application", "application", row["id"])
-    conn.commit()
+    with _txn(conn):
+        row = _insert(conn, "applications", {"job_id": job_id, "resume_id": resume_id})
+        _log_action(conn, "cli", "added application", "application", row["id"])
     return dict(row)
 
 
-def app_list(status: str | None = None) -> list[dict]:
+def app_list(status: str | None = None,
+             columns: tuple[str, ...] | None = None) -> list[dict]:
+    """List applications with their job title and company; `columns` projects applications."""
     conn = get_conn()
-    query = """
-        SELECT a.*, j.title as job_title, j.company_name
+    query = f"""
+        SELECT {_columns(columns, "a")}, j.title as job_title, j.company_name
         FROM applications a
         LEFT JOIN jobs j ON a.job_id = j.id
         WHERE 1=1
@@ -487,8 +885,7 @@ def app_list(status: str | None = None) -> list[dict]:
         query += " AND a.status = ?"
         params.append(status)
     query += " ORDER BY a.created_at DESC"
-    rows = conn.execute(query, params).fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(query, params)]
 
 
 def app_get(app_id: str) -> dict | None:
@@ -502,23 +899,29 @@ def app_get(app_id: str) -> dict | None:
     return dict(row) if row else None
 
 
+_STAMP_APPLIED = ("CASE WHEN COALESCE(applied_at, '') = '' THEN datetime('now') "
+                  "ELSE COALESCE(?, applied_at) END")
+
+
 def app_update(app_id: str, **kwargs) -> dict | None:
     conn = get_conn()
-    row = conn.execute("SELECT * FROM applications WHERE id = ?", (app_id,)).fetchone()
-    if not row:
-        return None
     allowed = {"status", "notes", "applied_at", "resume_id"}
     updates = {k: v for k, v in kwargs.items() if k in allowed and v is not None}
     if not updates:
         return app_get(app_id)
-    updates["updated_at"] = _now()
-    if updates.get("status") == "applied" and not row["applied_at"]:
-        updates["applied_at"] = _now()
-    set_clause = ", ".join(f"{k} = ?" for k in updates)
-    vals = list(updates.values()) + [app_id]
-    conn.execute(f"UPDATE applications SET {set_clause} WHERE id = ?", vals)
-    _log_action(conn, "cli", f"updated application ({', '.join(updates.keys())})", "application", app_id)
-    conn.commit()
+    exprs, params = (), []
+    if updates.get("status") == "applied":
+        # First move to applied stamps applied_at; later ones keep it unless overridden
+        exprs = (("applied_at", _STAMP_APPLIED),)
+        params = [updates.pop("applied_at", None)]
+    cols = tuple(sorted(updates))
+    vals = [updates[k] for k in cols] + params + [app_id]
+    with _txn(conn):
+        if not conn.execute(_update_sql("applications", cols, exprs=exprs), vals).rowcount:
+            return None
+        changed = [*updates, *(c for c, _ in exprs), "updated_at"]
+        _log_action(conn, "cli", f"updated application ({', '.join(changed)})",
+                    "application", app_id)
     return app_get(app_id)
 
 
@@ -527,9 +930,9 @@ def app_remove(app_id: str) -> bool:
     row = conn.execute("SELECT * FROM applications WHERE id = ?", (app_id,)).fetchone()
     if not row:
         return False
-    conn.execute("DELETE FROM applications WHERE id = ?", (app_id,))
-    _log_action(conn, "cli", "removed application", "application", app_id)
-    conn.commit()
+    with _txn(conn):
+        conn.execute("DELETE FROM applications WHERE id = ?", (app_id,))
+        _log_action(conn, "cli", "removed application", "application", app_id)
     return True
 
 
@@ -538,24 +941,20 @@ def app_remove(app_id: str) -> bool:
 def email_add(sender: str | None = None, subject: str | None = None,
               body: str | None = None, job_id: str | None = None) -> dict:
     conn = get_conn()
-    body_preview = body[:500] if body else None
-    cur = conn.execute(
-        "INSERT INTO emails (sender, subject, body_preview, job_id) VALUES (?, ?, ?, ?)",
-        (sender, subject, body_preview, job_id),
-    )
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM emails WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added email", "email", row["id"])
-    conn.commit()
+    with _txn(conn):
+        row = _insert(conn, "emails", {
+            "sender": sender, "subject": subject, "body_preview": body or None,
+            "job_id": job_id,
+        }, exprs={"body_preview": "substr(?, 1, 500)"})
+        _log_action(conn, "cli", "added email", "email", row["id"])
     return dict(row)
 
 
 def email_list(limit: int = 20) -> list[dict]:
     conn = get_conn()
-    rows = conn.execute(
+    return [dict(r) for r in conn.execute(
         "SELECT * FROM emails ORDER BY created_at DESC LIMIT ?", (limit,)
-    ).fetchall()
-    return [dict(r) for r in rows]
+    )]
 
 
 # --- Matches ---
@@ -564,22 +963,22 @@ def match_add(job_id: str, resume_id: str, score: int | None = None,
               strong_matches: str | None = None, gaps: str | None = None,
               red_flags: str | None = None, notes: str | None = None) -> dict:
     conn = get_conn()
-    cur = conn.execute(
-        "INSERT INTO matches (job_id, resume_id, score, strong_matches, gaps, red_flags, notes) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (job_id, resume_id, score, strong_matches, gaps, red_flags, notes),
-    )
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM matches WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added match analysis", "match", row["id"])
-    conn.commit()
+    with _txn(conn):
+        row = _insert(conn, "matches", {
+            "job_id": job_id, "resume_id": resume_id, "score": score,
+            "strong_matches": strong_matches, "gaps": gaps, "red_flags": red_flags,
+            "notes": notes,
+        })
+        _log_action(conn, "cli", "added match analysis", "match", row["id"])
     return dict(row)
 
 
-def match_list(job_id: str | None = None, min_score: int | None = None) -> list[dict]:
+def match_list(job_id: str | None = None, min_score: int | None = None,
+               columns: tuple[str, ...] | None = None) -> list[dict]:
+    """List matches, best first; `columns` projects matches (e.g. to skip the text fields)."""
     conn = get_conn()
-    query = """
-        SELECT m.*, j.title as job_title, j.company_name, r.name as resume_name
+    query = f"""
+        SELECT {_columns(columns, "m")}, j.title as job_title, j.company_name, r.name as resume_name
         FROM matches m
         LEFT JOIN jobs j ON m.job_id = j.id
         LEFT JOIN resumes r ON m.resume_id = r.id
@@ -593,8 +992,7 @@ def match_list(job_id: str | None = None, min_score: int | None = None) -> list[
         query += " AND m.score >= ?"
         params.append(min_score)
     query += " ORDER BY m.score DESC, m.created_at DESC"
-    rows = conn.execute(query, params).fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(query, params)]
 
 
 def match_get(match_id: str) -> dict | None:
@@ -612,24 +1010,31 @@ def match_get(match_id: str) -> dict | None:
 
 # --- Stats ---
 
-def get_stats() -> dict:
+def get_counts(*keys: str) -> dict[str, int]:
+    """Trigger-maintained row counts, e.g. get_counts("items", "active_items")."""
     conn = get_conn()
-    stats = {}
-    for table in ("companies", "jobs", "resumes", "applications", "emails", "matches"):
-        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-        stats[table] = count
+    counts = dict.fromkeys(keys, 0)
+    for r in conn.execute(
+        f"SELECT tbl, n FROM row_counts WHERE tbl IN ({', '.join('?' * len(keys))})", keys
+    ):
+        counts[r["tbl"]] = r["n"]
+    return counts
 
-    # Job status breakdown
-    rows = conn.execute(
-        "SELECT status, COUNT(*) as cnt FROM jobs GROUP BY status"
-    ).fetchall()
-    stats["jobs_by_status"] = {r["status"]: r["cnt"] for r in rows}
 
-    # Application status breakdown
+def get_stats() -> dict:
+    conn = get_conn()
+    stats: dict[str, Any] = get_counts(*_STATS_TABLES)
+    stats["jobs_by_status"] = {}
+    stats["apps_by_status"] = {}
+
     rows = conn.execute(
-        "SELECT status, COUNT(*) as cnt FROM applications GROUP BY status"
+        "SELECT 'jobs_by_status' AS breakdown, status, COUNT(*) AS cnt "
+        "FROM jobs GROUP BY status "
+        "UNION ALL "
+        "SELECT 'apps_by_status', status, COUNT(*) FROM applications GROUP BY status"
     ).fetchall()
-    stats["apps_by_status"] = {r["status"]: r["cnt"] for r in rows}
+    for r in rows:
+        stats[r["breakdown"]][r["status"]] = r["cnt"]
 
     return stats
 
@@ -639,24 +1044,19 @@ def get_stats() -> dict:
 def log_add(agent: str, action: str, entity_type: str,
             entity_id: str, details: str | None = None) -> dict:
     conn = get_conn()
-    cur = conn.execute(
-        "INSERT INTO task_runs (agent, action, entity_type, entity_id, details) "
-        "VALUES (?, ?, ?, ?, ?)",
-        (agent, action, entity_type, entity_id, details),
-    )
-    conn.commit()
-    row = conn.execute(
-        "SELECT * FROM task_runs WHERE rowid = ?", (cur.lastrowid,)
-    ).fetchone()
+    with _txn(conn):
+        row = _insert(conn, "task_runs", {
+            "agent": agent, "action": action, "entity_type": entity_type,
+            "entity_id": entity_id, "details": details,
+        })
     return dict(row)
 
 
 def log_list(limit: int = 20) -> list[dict]:
     conn = get_conn()
-    rows = conn.execute(
+    return [dict(r) for r in conn.execute(
         "SELECT * FROM task_runs ORDER BY created_at DESC LIMIT ?", (limit,)
-    ).fetchall()
-    return [dict(r) for r in rows]
+    )]
 
 
 # --- Domains ---
@@ -665,46 +1065,36 @@ def domain_add(name: str, description: str | None = None,
                keywords: str | None = None, instructions: str | None = None,
                schema: str | None = None, icon: str | None = None) -> dict:
     conn = get_conn()
-    try:
-        cur = conn.execute(
-            "INSERT INTO domains (name, description, keywords, instructions, schema, icon) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (name, description, keywords, instructions, schema, icon),
-        )
-    except sqlite3.IntegrityError:
-        # Already exists — return existing record
-        existing = domain_find(name)
-        if existing:
-            return existing
-        raise
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM domains WHERE rowid = ?", (row_id,)).fetchone()
-    _log_action(conn, "cli", "added domain", "domain", row["id"])
-    conn.commit()
+    with _txn(conn):
+        try:
+            row = _insert(conn, "domains", {
+                "name": name, "description": description, "keywords": keywords,
+                "instructions": instructions, "schema": schema, "icon": icon,
+            })
+        except sqlite3.IntegrityError:
+            # Already exists — return existing record
+            existing = domain_find(name)
+            if existing:
+                return existing
+            raise
+        _log_action(conn, "cli", "added domain", "domain", row["id"])
     return dict(row)
 
 
-def domain_list() -> list[dict]:
+def domain_list(columns: tuple[str, ...] | None = None) -> list[dict]:
     conn = get_conn()
-    rows = conn.execute("SELECT * FROM domains ORDER BY name").fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(
+        f"SELECT {_columns(columns)} FROM domains ORDER BY name"
+    )]
 
 
 def domain_find(name_or_id: str) -> dict | None:
     """Find a domain by exact ID or case-insensitive name match."""
     conn = get_conn()
-    row = conn.execute("SELECT * FROM domains WHERE id = ?", (name_or_id,)).fetchone()
-    if row:
-        return dict(row)
-    row = conn.execute(
-        "SELECT * FROM domains WHERE lower(name) = lower(?)", (name_or_id,)
-    ).fetchone()
+    row = _find_exact(conn, "domains", name_or_id)
     if row:
         return dict(row)
-    row = conn.execute(
-        "SELECT * FROM domains WHERE lower(name) LIKE ?",
-        (f"%{name_or_id.lower()}%",),
-    ).fetchone()
+    row = _find_fuzzy(conn, "domains", name_or_id)
     return dict(row) if row else None
 
 
@@ -717,13 +1107,13 @@ def domain_update(name_or_id: str, **kwargs) -> dict | None:
     updates = {k: v for k, v in kwargs.items() if k in allowed and v is not None}
     if not updates:
         return d
-    updates["updated_at"] = _now()
-    set_clause = ", ".join(f"{k} = ?" for k in updates)
-    vals = list(updates.values()) + [d["id"]]
-    conn.execute(f"UPDATE domains SET {set_clause} WHERE id = ?", vals)
-    _log_action(conn, "cli", f"updated domain ({', '.join(updates.keys())})", "domain", d["id"])
-    conn.commit()
-    return domain_find(d["id"])
+    cols = tuple(sorted(updates))
+    vals = [updates[k] for k in cols] + [d["id"]]
+    with _txn(conn):
+        updated = conn.execute(_update_sql("domains", cols, returning=True), vals).fetchone()
+        _log_action(conn, "cli", f"updated domain ({', '.join([*updates, 'updated_at'])})", "domain", d["id"])
+    _kw_cache.pop(d["id"], None)
+    return dict(updated) if updated is not None else domain_find(d["id"])
 
 
 def domain_remove(name_or_id: str) -> bool:
@@ -731,53 +1121,74 @@ def domain_remove(name_or_id: str) -> bool:
     if not d:
         return False
     conn = get_conn()
-    # Remove all items in this domain first
-    conn.execute("DELETE FROM items WHERE domain_id = ?", (d["id"],))
-    conn.execute("DELETE FROM domains WHERE id = ?", (d["id"],))
-    _log_action(conn, "cli", "removed domain", "domain", d["id"])
-    conn.commit()
+    with _txn(conn):
+        # Remove all items in this domain first
+        conn.execute("DELETE FROM items WHERE domain_id = ?", (d["id"],))
+        conn.execute("DELETE FROM domains WHERE id = ?", (d["id"],))
+        _log_action(conn, "cli", "removed domain", "domain", d["id"])
+    _kw_cache.pop(d["id"], None)
     return True
 
 
+# Parsed keywords per domain id, stored with the raw JSON they came from so
+# edits made outside domain_update (e.g. the web UI) are still picked up.
+_kw_cache: dict[str, tuple[str, list[tuple[str, str]]]] = {}
+
+
+def _domain_keywords(domain_id: str, kw_raw: str) -> list[tuple[str, str]]:
+    """Return [(keyword, keyword.lower()), ...] for a domain, parsing at most once."""
+    cached = _kw_cache.get(domain_id)
+    if cached is not None and cached[0] == kw_raw:
+        return cached[1]
+    try:
+        keywords = [(kw, kw.lower()) for kw in json.loads(kw_raw)]
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        keywords = []
+    _kw_cache[domain_id] = (kw_raw, keywords)
+    return keywords
+
+
 def detect_domain(message: str) -> list[dict]:
     """Score each domain against a message by keyword overlap.
 
     Returns domains sorted by score descending, filtered to score > 0.
     """
     conn = get_conn()
-    domains = conn.execute("SELECT * FROM domains").fetchall()
+    domains = [
+        (d, keywords) for d in conn.execute("SELECT * FROM domains")
+        if (keywords := _domain_keywords(d["id"], d["keywords"] or "[]"))
+    ]
+    # Only keyword-length prefixes are ever probed; this keeps a long token
+    # (a pasted URL or blob) from costing time quadratic in its length
+    max_kw = max((len(kw_lower) for _, keywords in domains for _, kw_lower in keywords), default=0)
 
-    words = set(message.lower().split())
     message_lower = message.lower()
+    words = set(message_lower.split())
+    # Prefix/stem matching as set probes, built once per message:
+    #   keyword starts with a word, or with a word's stem (word minus 2
+    #   chars, words of 6+ chars) -> some prefix of the keyword is in `stems`
+    #   a word starts with the keyword's stem (keywords of 6+ chars)
+    #   -> keyword stem is in `word_prefixes`
+    # "exercise" <-> "exercising" share the stem "exercis".
+    stems = words | {w[:-2] for w in words if len(w) >= 6}
+    word_prefixes = {w[:i] for w in words for i in range(1, min(len(w), max_kw) + 1)}
+    max_stem = max(map(len, stems), default=0)
 
     results = []
-    for d in domains:
+    for d, keywords in domains:
         d = dict(d)
-        kw_raw = d.get("keywords") or "[]"
-        try:
-            keywords = json.loads(kw_raw)
-        except (json.JSONDecodeError, TypeError):
-            continue
-        if not keywords:
-            continue
 
         score = 0.0
         matched = []
-        for kw in keywords:
-            kw_lower = kw.lower()
+        for kw, kw_lower in keywords:
             if kw_lower in words:
                 score += 1.0
                 matched.append(kw)
             elif kw_lower in message_lower:
                 score += 0.5
                 matched.append(kw)
-            elif any(
-                w.startswith(kw_lower) or kw_lower.startswith(w) or
-                # Stem matching: "exercise" ↔ "exercising" (shared prefix minus inflection)
-                # Require stem (word minus 2 chars) to be at least 4 chars
-                (len(kw_lower) >= 6 and w.startswith(kw_lower[:-2])) or
-                (len(w) >= 6 and kw_lower.startswith(w[:-2]))
-                for w in words
+            elif (len(kw_lower) >= 6 and kw_lower[:-2] in word_prefixes) or any(
+                kw_lower[:i] in stems for i in range(1, min(len(kw_lower), max_stem) + 1)
             ):
                 score += 0.5
                 matched.append(kw)
@@ -803,22 +1214,45 @@ def _resolve_domain(domain: str) -> dict:
 def item_add(domain: str, title: str, type: str = "note",
              data: str | None = None, tags: str | None = None,
              status: str = "active", priority: int | None = None,
-             due_at: str | None = None) -> dict:
+             due_at: str | None = None, agent: str = "cli") -> dict:
     d = _resolve_domain(domain)
     conn = get_conn()
-    cur = conn.execute(
-        "INSERT INTO items (domain_id, type, title, data, tags, status, priority, due_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        (d["id"], type, title, data, tags, status, priority, due_at),
-    )
-    row_id = cur.lastrowid
-    row = conn.execute("SELECT * FROM items WHERE rowid = ?", (row_id,)).fetchone()
-    # FTS index is updated automatically via trigger
-    _log_action(conn, "cli", f"added item ({type})", "item", row["id"])
-    conn.commit()
+    with _txn(conn):
+        row = _insert(conn, "items", {
+            "domain_id": d["id"], "type": type, "title": title, "data": data,
+            "tags": tags, "status": status, "priority": priority, "due_at": due_at,
+        })
+        # FTS index is updated automatically via trigger
+        _log_action(conn, agent, f"added item ({type})", "item", row["id"])
     return dict(row)
 
 
+def item_add_many(domain: str, items: list[dict[str, Any]]) -> list[dict]:
+    """Add several items to one domain in a single transaction.
+
+    Each dict takes item_add's keyword arguments (title required). Returns the
+    new rows in input order.
+    """
+    d = _resolve_domain(domain)
+    params = [
+        (d["id"], it.get("type", "note"), it["title"], it.get("data"), it.get("tags"),
+         it.get("status", "active"), it.get("priority"), it.get("due_at"))
+        for it in items
+    ]
+    if not params:
+        return []
+    conn = get_conn()
+    with _txn(conn):
+        rows = _insert_many(
+            conn, "items",
+            ("domain_id", "type", "title", "data", "tags", "status", "priority", "due_at"),
+            params,
+        )
+        # FTS index is updated automatically via trigger
+        _log_action_many(conn, "cli", [(f"added item ({r['type']})", "item", r["id"]) for r in rows])
+    return [dict(r) for r in rows]
+
+
 def item_list(domain: str | None = None, type: str | None = None,
               status: str | None = None, sort: str = "created",
               limit: int = 50) -> list[dict]:
@@ -843,18 +1277,29 @@ def item_list(domain: str | None = None, type: str | None = None,
         query += " AND i.status = ?"
         params.append(status)
 
+    if sort == "due":
+        # Dated items in due order (served by idx_items_due), then undated
+        # ones to fill the limit -- avoids sorting the whole table for NULLS LAST.
+        rows = [dict(r) for r in conn.execute(
+            query + " AND i.due_at IS NOT NULL ORDER BY i.due_at ASC LIMIT ?", [*params, limit]
+        )]
+        if limit < 0 or len(rows) < limit:
+            rows += [dict(r) for r in conn.execute(
+                query + " AND i.due_at IS NULL ORDER BY i.created_at DESC LIMIT ?",
+                [*params, limit - len(rows) if limit >= 0 else -1],
+            )]
+        return rows
+
     sort_map = {
         "created": "i.created_at DESC",
         "updated": "i.updated_at DESC",
-        "due": "i.due_at ASC NULLS LAST",
         "priority": "i.priority ASC NULLS LAST, i.created_at DESC",
     }
     query += f" ORDER BY {sort_map.get(sort, 'i.created_at DESC')}"
     query += " LIMIT ?"
     params.append(limit)
 
-    rows = conn.execute(query, params).fetchall()
-    return [dict(r) for r in rows]
+    return [dict(r) for r in conn.execute(query, params)]
 
 
 def item_get(item_id: str) -> dict | None:
@@ -877,13 +1322,12 @@ def item_update(item_id: str, **kwargs) -> dict | None:
     updates = {k: v for k, v in kwargs.items() if k in allowed and v is not None}
     if not updates:
         return item_get(item_id)
-    updates["updated_at"] = _now()
-    set_clause = ", ".join(f"{k} = ?" for k in updates)
-    vals = list(updates.values()) + [item_id]
-    conn.execute(f"UPDATE items SET {set_clause} WHERE id = ?", vals)
-    # FTS index is updated automatically via trigger
-    _log_action(conn, "cli", f"updated item ({', '.join(updates.keys())})", "item", item_id)
-    conn.commit()
+    cols = tuple(sorted(updates))
+    vals = [updates[k] for k in cols] + [item_id]
+    with _txn(conn):
+        conn.execute(_update_sql("items", cols), vals)
+        # FTS index is updated automatically via trigger
+        _log_action(conn, "cli", f"updated item ({', '.join([*updates, 'updated_at'])})", "item", item_id)
     return item_get(item_id)
 
 
@@ -892,10 +1336,10 @@ def item_remove(item_id: str) -> bool:
     row = conn.execute("SELECT id FROM items WHERE id = ?", (item_id,)).fetchone()
     if not row:
         return False
-    # FTS index is cleaned up automatically via trigger
-    conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
-    _log_action(conn, "cli", "removed item", "item", item_id)
-    conn.commit()
+    with _txn(conn):
+        # FTS index is cleaned up automatically via trigger
+        conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        _log_action(conn, "cli", "removed item", "item", item_id)
     return True
 
 
@@ -920,8 +1364,7 @@ def item_search(query: str, domain: str | None = None,
     sql += " ORDER BY rank LIMIT ?"
     params.append(limit)
     try:
-        rows = conn.execute(sql, params).fetchall()
-        return [dict(r) for r in rows]
+        return [dict(r) for r in conn.execute(sql, params)]
     except sqlite3.OperationalError:
         return []  # FTS not available
 
@@ -931,23 +1374,26 @@ def item_stats(domain: str) -> dict:
     d = _resolve_domain(domain)
     conn = get_conn()
 
-    total = conn.execute(
-        "SELECT COUNT(*) FROM items WHERE domain_id = ?", (d["id"],)
-    ).fetchone()[0]
-
-    by_type = conn.execute(
-        "SELECT type, COUNT(*) as cnt FROM items WHERE domain_id = ? GROUP BY type",
+    # One grouped scan; totals per type and per status are summed from it
+    total = 0
+    by_type: dict[Any, int] = {}
+    by_status: dict[Any, int] = {}
+    for r in conn.execute(
+        "SELECT type, status, COUNT(*) as cnt FROM items WHERE domain_id = ? "
+        "GROUP BY type, status",
         (d["id"],),
-    ).fetchall()
+    ):
+        total += r["cnt"]
+        by_type[r["type"]] = by_type.get(r["type"], 0) + r["cnt"]
+        by_status[r["status"]] = by_status.get(r["status"], 0) + r["cnt"]
 
-    by_status = conn.execute(
-        "SELECT status, COUNT(*) as cnt FROM items WHERE domain_id = ? GROUP BY status",
-        (d["id"],),
-    ).fetchall()
+    def _ordered(counts: dict) -> dict:
+        # Same key order as GROUP BY (NULL first)
+        return dict(sorted(counts.items(), key=lambda kv: (kv[0] is not None, kv[0] or "")))
 
     return {
         "domain": d["name"],
         "total": total,
-        "by_type": {r["type"]: r["cnt"] for r in by_type},
-        "by_status": {r["status"]: r["cnt"] for r in by_status},
+        "by_type": by_type,
+        "by_status": _ordered(by_status),
     }
@@ -0,0 +1,43 @@
+"""
+Typer-free entry point for the per-message hot command.
+
+Agents run `applyops domain detect "..."` on every incoming message (see
+PROTOCOL.md), and importing Typer/Click costs more than the detection query.
+main() answers that exact form directly and hands every other invocation to
+the full Typer app in cli.py.
+"""
+from __future__ import annotations
+
+import sys
+
+from . import db
+
+
+def print_detect(message: str) -> None:
+    """Print domain detection results (shared with the Typer command)."""
+    results = db.detect_domain(message)
+    if not results:
+        print("No domain matched.")
+        print("\nCreate one with: uv run applyops domain add <name> --keywords '[...]'")
+        return
+    for d in results:
+        matched = ", ".join(d.get("_matched", []))
+        print(f"  {d['name']} (score: {d['_score']}, matched: {matched})")
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if len(args) == 3 and args[:2] == ["domain", "detect"] and not args[2].startswith("-"):
+        print_detect(args[2])
+        return
+    from .cli import _SUBAPPS, _register_extensions, app
+    # Typer builds Click objects for every group it sees, so run an invoked
+    # built-in group on its own, without importing the jobs extension.
+    # Anything else (--help, top-level commands, typos, the extension's own
+    # groups) gets the full app so listings stay complete.
+    name = args[0] if args else None
+    if name in _SUBAPPS:
+        _SUBAPPS[name](args=args[1:], prog_name=f"applyops {name}")
+        return
+    _register_extensions(app)
+    app()
@@ -0,0 +1,114 @@
+"""Full-text index of memory files for /memory/search.
+
+Bodies live in a trigram FTS5 table in memory/.index.db, so a case-insensitive
+substring search is an index lookup instead of a read of every file. Before each
+query the index is refreshed from the directory listing: only files whose
+mtime or size changed are re-read.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+MEMORY_TYPES = ("semantic", "episodic", "procedural")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    memory_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS mem USING fts5(body, tokenize='trigram');
+"""
+
+_lock = threading.Lock()
+_conns: dict[Path, sqlite3.Connection] = {}
+
+
+def _connect(memory_dir: Path) -> sqlite3.Connection:
+    conn = _conns.get(memory_dir)
+    if conn is None:
+        conn = sqlite3.connect(str(memory_dir / ".index.db"), check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        _conns[memory_dir] = conn
+    return conn
+
+
+def list_files(memory_dir: Path) -> dict[str, tuple[str, str, int, int]]:
+    """path -> (memory_type, name, mtime_ns, size) for every searchable file."""
+    found = {}
+    for memory_type in MEMORY_TYPES:
+        try:
+            with os.scandir(memory_dir / memory_type) as it:
+                for e in it:
+                    if e.name.endswith(".md") and not e.name.startswith(("_", ".")) and e.is_file():
+                        st = e.stat()
+                        found[f"{memory_type}/{e.name}"] = (memory_type, e.name, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            continue
+    return found
+
+
+def _refresh(conn: sqlite3.Connection, memory_dir: Path):
+    """Bring the index in line with the files on disk."""
+    found = list_files(memory_dir)
+    indexed = {path: (id_, mtime_ns, size)
+               for path, id_, mtime_ns, size in conn.execute("SELECT path, id, mtime_ns, size FROM files")}
+    removed = [indexed[p][0] for p in indexed.keys() - found.keys()]
+    changed = [(p, meta) for p, meta in found.items()
+               if p not in indexed or indexed[p][1:] != meta[2:]]
+    if not removed and not changed:
+        return
+    with conn:
+        for id_ in removed:
+            conn.execute("DELETE FROM mem WHERE rowid = ?", (id_,))
+            conn.execute("DELETE FROM files WHERE id = ?", (id_,))
+        for path, (memory_type, name, mtime_ns, size) in changed:
+            try:
+                body = (memory_dir / path).read_text(encoding="utf-8", errors="replace")
+            except FileNotFoundError:
+                continue
+            if path in indexed:
+                id_ = indexed[path][0]
+                conn.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?", (mtime_ns, size, id_))
+                conn.execute("DELETE FROM mem WHERE rowid = ?", (id_,))
+            else:
+                id_ = conn.execute(
+                    "INSERT INTO files (path, memory_type, name, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+                    (path, memory_type, name, mtime_ns, size),
+                ).lastrowid
+            conn.execute("INSERT INTO mem (rowid, body) VALUES (?, ?)", (id_, body))
+
+
+def search(memory_dir: Path, query: str) -> list[tuple[str, str, str]]:
+    """(memory_type, name, body) of files containing `query`, case-insensitively.
+
+    Only for ASCII queries without LIKE wildcards (see is_indexable): FTS5 skips
+    the trigram index for a LIKE with an ESCAPE clause, and SQLite's like() only
+    case-folds ASCII. Raises sqlite3.OperationalError where the trigram tokenizer
+    is unavailable (SQLite < 3.34); callers fall back to scanning the files.
+    """
+    with _lock:
+        conn = _connect(memory_dir)
+        _refresh(conn, memory_dir)
+        return conn.execute(
+            """
+            SELECT f.memory_type, f.name, m.body
+            FROM mem m
+            JOIN files f ON f.id = m.rowid
+            WHERE m.body LIKE ?
+            ORDER BY CASE f.memory_type WHEN 'semantic' THEN 0 WHEN 'episodic' THEN 1 ELSE 2 END,
+                     f.name
+            """,
+            (f"%{query}%",),
+        ).fetchall()
+
+
+def is_indexable(query: str) -> bool:
+    """Whether search() can answer `query` exactly."""
+    return query.isascii() and not any(c in query for c in "%_\\")
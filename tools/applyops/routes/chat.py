@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
@@ -12,13 +12,44 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, StreamingResponse
 
 from bot.agents import run_agent, AGENTS
+from .._json import dumps
 from ..templates import templates
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# session key → agent session_id
-_chat_sessions: dict[str, str] = {}
+
+class _SessionCache:
+    """Bounded LRU of session key → agent session_id; entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# session key → agent session_id (keys are client-supplied, so keep it bounded)
+_chat_sessions = _SessionCache()
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -32,7 +63,7 @@ async def chat_interface(request: Request):
 @router.get("/stream")
 async def stream_response(message: str = "", agent: str = "opencode", session: str = ""):
     """SSE endpoint — named events: progress | response | files | error | done.
-    Keepalive comment lines are sent every 5s so the connection stays alive.
+    Keepalive comment lines are sent after 5s without events so the connection stays alive.
     """
     if agent not in AGENTS:
         async def _err():
@@ -49,7 +80,7 @@ async def stream_response(message: str = "", agent: str = "opencode", session: s
         yield ": connected\n\n"
 
         progress_queue: asyncio.Queue[str] = asyncio.Queue()
-        result: dict = {"text": "", "files": [], "done": False, "error": None}
+        result: dict = {"text": "", "files": [], "error": None}
 
         async def on_progress(msg: str) -> None:
             await progress_queue.put(msg)
@@ -64,34 +95,37 @@ async def stream_response(message: str = "", agent: str = "opencode", session: s
             except Exception as e:
                 logger.exception("Agent error in chat stream")
                 result["error"] = str(e)
-            finally:
-                result["done"] = True
 
         task = asyncio.create_task(run())
-        last_keepalive = time.monotonic()
-
-        while not result["done"]:
-            # Drain any progress events
-            try:
-                msg = await asyncio.wait_for(progress_queue.get(), timeout=0.5)
-                yield f"event: progress\ndata: {msg}\n\n"
-            except asyncio.TimeoutError:
-                pass
-
-            # Keepalive every 5s to prevent proxy/browser timeouts
-            if time.monotonic() - last_keepalive > 5:
-                yield ": keepalive\n\n"
-                last_keepalive = time.monotonic()
+        next_progress = asyncio.create_task(progress_queue.get())
+        try:
+            # Sleep until a progress event arrives or the agent finishes; a 5s
+            # idle timeout doubles as the keepalive to prevent proxy/browser timeouts
+            while not task.done():
+                done, _ = await asyncio.wait(
+                    {next_progress, task}, timeout=5.0, return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_progress in done:
+                    yield f"event: progress\ndata: {next_progress.result()}\n\n"
+                    next_progress = asyncio.create_task(progress_queue.get())
+                elif not done:
+                    yield ": keepalive\n\n"
+        finally:
+            next_progress.cancel()
+
+        # Progress sent just before the agent returned
+        while not progress_queue.empty():
+            yield f"event: progress\ndata: {progress_queue.get_nowait()}\n\n"
 
         await task
 
         if result["error"]:
             yield f"event: error\ndata: {result['error']}\n\n"
         else:
-            yield f"event: response\ndata: {json.dumps(result['text'])}\n\n"
+            yield f"event: response\ndata: {dumps(result['text'])}\n\n"
             if result["files"]:
                 names = [f.name for f in result["files"]]
-                yield f"event: files\ndata: {json.dumps(names)}\n\n"
+                yield f"event: files\ndata: {dumps(names)}\n\n"
 
         yield "event: done\ndata: \n\n"
 
@@ -1,6 +1,8 @@
 """Dashboard routes — main landing page and overview."""
 from __future__ import annotations
 
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -9,14 +11,71 @@ from fastapi.responses import HTMLResponse
 
 from ..db import DB_PATH
 from ..templates import templates
-from ..db import get_conn
+from ..db import get_conn, get_counts
 
 router = APIRouter()
 
+MEMORY_DIR = Path(__file__).parent.parent.parent.parent / "memory" / "episodic"
+_MEMORY_TTL = 30.0
+_memories_cache: tuple[float, list[dict]] | None = None
+_STATS_TTL = 5.0
+_stats_cache: tuple[float, dict] | None = None
+
+
+def _scan_recent_memories(limit: int = 5) -> list[dict]:
+    """Newest episodic memory files, statting each entry once."""
+    try:
+        with os.scandir(MEMORY_DIR) as it:
+            entries = [(e.stat(), e.name) for e in it
+                       if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e[0].st_mtime, reverse=True)
+    return [
+        {
+            "name": name,
+            "modified": datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M"),
+            "size": f"{st.st_size / 1024:.1f} KB"
+        }
+        for st, name in entries[:limit]
+    ]
+
+
+def _recent_memories() -> list[dict]:
+    """Recent memory listing, rescanned at most every 30s."""
+    global _memories_cache
+    now = time.monotonic()
+    if _memories_cache is not None and now - _memories_cache[0] < _MEMORY_TTL:
+        return _memories_cache[1]
+    memories = _scan_recent_memories()
+    _memories_cache = (now, memories)
+    return memories
+
+
+def _live_stats() -> dict:
+    """Counters and DB size for the stats fragment, shared by pollers for 5s."""
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache is not None and now - _stats_cache[0] < _STATS_TTL:
+        return _stats_cache[1]
+    counts = get_counts("domains", "items", "active_items")
+    try:
+        db_size = f"{DB_PATH.stat().st_size / (1024*1024):.2f} MB"
+    except FileNotFoundError:
+        db_size = "N/A"
+    stats = {
+        "total_domains": counts["domains"],
+        "total_items": counts["items"],
+        "active_items": counts["active_items"],
+        "db_size": db_size
+    }
+    _stats_cache = (now, stats)
+    return stats
+
 
 @router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Main dashboard view."""
+def dashboard(request: Request):
+    """Main dashboard view (sync, so FastAPI runs it in the threadpool)."""
     # Get recent activity from database
     db = get_conn()
     
@@ -48,17 +107,7 @@ async def dashboard(request: Request):
     ).fetchall()
     
     # Recent memory files
-    memory_dir = Path(__file__).parent.parent.parent.parent / "memory" / "episodic"
-    recent_memories = []
-    if memory_dir.exists():
-        files = sorted(memory_dir.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-        for f in files[:5]:
-            stat = f.stat()
-            recent_memories.append({
-                "name": f.name,
-                "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
-                "size": f"{stat.st_size / 1024:.1f} KB"
-            })
+    recent_memories = _recent_memories()
     
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
@@ -71,18 +120,9 @@ async def dashboard(request: Request):
 
 
 @router.get("/stats", response_class=HTMLResponse)
-async def stats_fragment(request: Request):
+def stats_fragment(request: Request):
     """HTMX fragment for live stats refresh."""
-    db = get_conn()
-    
-    stats = {
-        "total_domains": db.execute("SELECT COUNT(*) FROM domains").fetchone()[0],
-        "total_items": db.execute("SELECT COUNT(*) FROM items").fetchone()[0],
-        "active_items": db.execute("SELECT COUNT(*) FROM items WHERE status = 'active'").fetchone()[0],
-        "db_size": f"{DB_PATH.stat().st_size / (1024*1024):.2f} MB" if DB_PATH.exists() else "N/A"
-    }
-    
     return templates.TemplateResponse("fragments/stats.html", {
         "request": request,
-        "stats": stats
+        "stats": _live_stats()
     })
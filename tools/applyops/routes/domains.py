@@ -1,18 +1,30 @@
 """Domain and item management routes."""
 from __future__ import annotations
 
-import json
 from fastapi import APIRouter, Request, Form, HTTPException
 from fastapi.responses import HTMLResponse
 
-from ..db import get_conn
+from .._json import loads
+from ..db import bulk, get_conn, item_add, log_add
 from ..templates import templates
 
 router = APIRouter()
 
+# Columns fragments/item_row.html renders
+_ROW_COLUMNS = "id, type, status, title, data, tags"
+
+# Display order of a domain's items: active, then pending, then the rest
+_ITEM_ORDER = """
+            CASE status
+                WHEN 'active' THEN 1
+                WHEN 'pending' THEN 2
+                ELSE 3
+            END,
+            created_at DESC"""
+
 
 @router.get("/", response_class=HTMLResponse)
-async def list_domains(request: Request):
+def list_domains(request: Request):
     """List all domains."""
     db = get_conn()
     domains = db.execute("""
@@ -34,18 +46,18 @@ def _parse_item(item) -> dict:
     """Convert a DB row to a dict with parsed data and tags."""
     d = dict(item)
     try:
-        d["data_parsed"] = json.loads(d.get("data") or "{}")
+        d["data_parsed"] = loads(d.get("data") or "{}")
     except Exception:
         d["data_parsed"] = {}
     try:
-        d["tags_parsed"] = json.loads(d.get("tags") or "[]")
+        d["tags_parsed"] = loads(d.get("tags") or "[]")
     except Exception:
         d["tags_parsed"] = []
     return d
 
 
 @router.get("/{domain_id}", response_class=HTMLResponse)
-async def view_domain(request: Request, domain_id: str):
+def view_domain(request: Request, domain_id: str):
     """View a specific domain and its items."""
     db = get_conn()
 
@@ -56,16 +68,10 @@ async def view_domain(request: Request, domain_id: str):
     if not domain:
         raise HTTPException(status_code=404, detail="Domain not found")
 
-    rows = db.execute("""
+    rows = db.execute(f"""
         SELECT * FROM items
         WHERE domain_id = ?
-        ORDER BY
-            CASE status
-                WHEN 'active' THEN 1
-                WHEN 'pending' THEN 2
-                ELSE 3
-            END,
-            created_at DESC
+        ORDER BY {_ITEM_ORDER}
     """, (domain_id,)).fetchall()
 
     items = [_parse_item(r) for r in rows]
@@ -80,7 +86,7 @@ async def view_domain(request: Request, domain_id: str):
 
 
 @router.post("/{domain_id}/items", response_class=HTMLResponse)
-async def create_item(
+def create_item(
     request: Request,
     domain_id: str,
     title: str = Form(...),
@@ -88,60 +94,61 @@ async def create_item(
     status: str = Form("active")
 ):
     """Create a new item in a domain (HTMX form submission)."""
-    db = get_conn()
-    
-    # Verify domain exists
-    domain = db.execute(
+    # Verify domain exists; item_add would also accept a fuzzy name match
+    domain = get_conn().execute(
         "SELECT id FROM domains WHERE id = ?", (domain_id,)
     ).fetchone()
-    
+
     if not domain:
         raise HTTPException(status_code=404, detail="Domain not found")
-    
-    cursor = db.execute("""
-        INSERT INTO items (domain_id, title, type, status, data, tags)
-        VALUES (?, ?, ?, ?, '{}', '[]')
-    """, (domain_id, title, item_type, status))
-    
-    db.commit()
 
-    # Return updated item list fragment
-    rows = db.execute("""
-        SELECT * FROM items
+    item = item_add(domain_id, title, type=item_type, status=status,
+                    data="{}", tags="[]", agent="web")
+
+    # A new active item is the newest of the first status group, so its card
+    # goes straight into the top of #items-grid (hx-swap="afterbegin"). New
+    # items carry no tags, so the tag filter bar never needs refreshing here.
+    if status == "active":
+        return templates.TemplateResponse("fragments/item_row.html", {
+            "request": request,
+            "item": _parse_item(item),
+        })
+
+    # Any other status lands further down: re-render the whole grid in order
+    rows = get_conn().execute(f"""
+        SELECT {_ROW_COLUMNS} FROM items
         WHERE domain_id = ?
-        ORDER BY created_at DESC
+        ORDER BY {_ITEM_ORDER}
     """, (domain_id,)).fetchall()
 
-    items = [_parse_item(r) for r in rows]
-    all_tags = sorted({tag for item in items for tag in item["tags_parsed"]})
-
     return templates.TemplateResponse("fragments/item_list.html", {
         "request": request,
-        "items": items,
-        "all_tags": all_tags,
-    })
+        "items": [_parse_item(r) for r in rows],
+    }, headers={"HX-Reswap": "outerHTML"})
 
 
 @router.post("/items/{item_id}/status", response_class=HTMLResponse)
-async def update_item_status(
+def update_item_status(
     request: Request,
     item_id: str,
     status: str = Form(...)
 ):
     """Update item status inline."""
-    db = get_conn()
-    
-    db.execute(
-        "UPDATE items SET status = ? WHERE id = ?",
-        (status, item_id)
-    )
-    db.commit()
-    
-    # Return updated item card
-    row = db.execute(
-        "SELECT * FROM items WHERE id = ?", (item_id,)
-    ).fetchone()
+    # The update reads back just the card's columns (item_update selects the
+    # row before and after), and commits together with its log entry
+    with bulk() as db:
+        row = db.execute(f"""
+            UPDATE items SET status = ?, updated_at = datetime('now')
+            WHERE id = ?
+            RETURNING {_ROW_COLUMNS}
+        """, (status, item_id)).fetchone()
+        if row:
+            log_add("web", "updated item (status, updated_at)", "item", item_id)
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Item not found")
 
+    # Return updated item card
     return templates.TemplateResponse("fragments/item_row.html", {
         "request": request,
         "item": _parse_item(row),
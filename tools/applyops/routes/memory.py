@@ -1,72 +1,141 @@
 """Memory browsing routes — semantic, episodic, procedural."""
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import os
+import sqlite3
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
 from fastapi import APIRouter, Request, HTTPException, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 
 from ..templates import templates
+from . import _memory_index
 
 router = APIRouter()
 
 MEMORY_DIR = Path(__file__).parent.parent.parent.parent / "memory"
 
 
-def _get_memory_files(memory_type: str) -> list[dict]:
-    """Get all memory files of a given type."""
+# memory_type -> (signature, files); the signature is (name, mtime_ns, size) per
+# listed file, so an unchanged directory is served without re-reading anything
+_LIST_CACHE: dict[str, tuple[tuple, list[dict]]] = {}
+# Rendered landing page keyed by the three listing signatures
+_INDEX_CACHE: tuple[tuple, bytes] | None = None
+
+
+def _preview(path: Path) -> str:
+    """First line of a memory file, truncated for the listing."""
+    # readline(101) bounds the read even for a huge single-line file
+    with path.open("r", encoding="utf-8", errors="replace") as fh:
+        return fh.readline(101).rstrip("\n")[:100]
+
+
+def _memory_listing(memory_type: str) -> tuple[tuple, list[dict]]:
+    """(signature, files) for a memory type; a missing directory lists as empty."""
     dir_path = MEMORY_DIR / memory_type
-    if not dir_path.exists():
-        return []
-    
+    try:
+        with os.scandir(dir_path) as it:
+            entries = [(e.name, e.stat()) for e in it
+                       if e.name.endswith(".md") and not e.name.startswith(("_", ".")) and e.is_file()]
+    except FileNotFoundError:
+        return (), []
+    entries.sort(key=lambda e: e[1].st_mtime, reverse=True)
+
+    signature = tuple((name, st.st_mtime_ns, st.st_size) for name, st in entries)
+    cached = _LIST_CACHE.get(memory_type)
+    if cached and cached[0] == signature:
+        return cached
+    # Only files that changed since the last listing are re-read for their preview
+    previews = dict(zip(cached[0], (f["preview"] for f in cached[1]))) if cached else {}
+
+    rel_dir = dir_path.relative_to(MEMORY_DIR.parent)
     files = []
-    for f in sorted(dir_path.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True):
-        if f.name.startswith("_") or f.name.startswith("."):
-            continue
-        stat = f.stat()
-        content = f.read_text()
-        # Extract first line as preview
-        preview = content.split("\n")[0][:100] if content else ""
+    for key, (name, stat) in zip(signature, entries):
+        preview = previews.get(key)
+        if preview is None:
+            preview = _preview(dir_path / name)
         files.append({
-            "name": f.name,
-            "path": str(f.relative_to(MEMORY_DIR.parent)),
+            "name": name,
+            "path": str(rel_dir / name),
             "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
             "size": f"{stat.st_size / 1024:.1f} KB",
             "preview": preview
         })
-    return files
+    _LIST_CACHE[memory_type] = (signature, files)
+    return signature, files
+
+
+@lru_cache(maxsize=4)
+def _resolved_root(memory_dir: Path) -> str:
+    return str(memory_dir.resolve())
 
 
 def _get_file_path(memory_type: str, filename: str) -> Path | None:
     """Get validated file path or None if invalid."""
     # Prevent directory traversal
-    if ".." in filename or filename.startswith("/"):
+    if ".." in filename or filename.startswith("/") or "\0" in filename or "\0" in memory_type:
         return None
     
-    file_path = MEMORY_DIR / memory_type / filename
+    # Lexical check against the resolved memory dir; no filesystem walk needed
+    root = _resolved_root(MEMORY_DIR)
+    candidate = os.path.normpath(os.path.join(root, memory_type, filename))
+    if not candidate.startswith(root + os.sep):
+        return None
     
-    # Security check - ensure path is within memory dir
-    try:
-        resolved_path = file_path.resolve()
-        resolved_memory = MEMORY_DIR.resolve()
-        if not str(resolved_path).startswith(str(resolved_memory)):
+    # Symlinks can point outside the memory dir, so if any component below the
+    # root is one (filename may hold subdirectories), resolve for real
+    part = candidate
+    while part != root and not os.path.islink(part):
+        part = os.path.dirname(part)
+    if part != root:
+        try:
+            if not str(Path(candidate).resolve()).startswith(root + os.sep):
+                return None
+        except (OSError, ValueError):
             return None
-    except (OSError, ValueError):
-        return None
     
-    return file_path
+    return Path(candidate)
+
+
+def _file_etag(file_path: Path) -> str:
+    """ETag from the file's mtime and size; 404 if the file does not exist."""
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in (t.strip() for t in if_none_match.split(","))
 
 
 @router.get("/", response_class=HTMLResponse)
 async def memory_index(request: Request):
     """Memory browser landing page."""
-    return templates.TemplateResponse("memory/index.html", {
+    global _INDEX_CACHE
+    # The three directory scans run concurrently in worker threads
+    listings = await asyncio.gather(
+        asyncio.to_thread(_memory_listing, "semantic"),
+        asyncio.to_thread(_memory_listing, "episodic"),
+        asyncio.to_thread(_memory_listing, "procedural"),
+    )
+    key = tuple(signature for signature, _ in listings)
+    if _INDEX_CACHE is not None and _INDEX_CACHE[0] == key:
+        return HTMLResponse(_INDEX_CACHE[1])
+    (_, semantic), (_, episodic), (_, procedural) = listings
+    response = templates.TemplateResponse("memory/index.html", {
         "request": request,
-        "semantic": _get_memory_files("semantic"),
-        "episodic": _get_memory_files("episodic"),
-        "procedural": _get_memory_files("procedural")
+        "semantic": semantic,
+        "episodic": episodic,
+        "procedural": procedural
     })
+    _INDEX_CACHE = (key, response.body)
+    return response
 
 
 @router.get("/view/{memory_type}/{filename}", response_class=HTMLResponse)
@@ -77,8 +146,11 @@ async def view_memory(request: Request, memory_type: str, filename: str):
     if not file_path:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    # Browsers revalidate (no-cache) and get a 304 while the file is unchanged
+    etag = _file_etag(file_path)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
     
     content = file_path.read_text()
     
@@ -87,7 +159,7 @@ async def view_memory(request: Request, memory_type: str, filename: str):
         "filename": filename,
         "memory_type": memory_type,
         "content": content
-    })
+    }, headers=headers)
 
 
 @router.get("/edit/{memory_type}/{filename}", response_class=HTMLResponse)
@@ -98,8 +170,11 @@ async def edit_memory_form(request: Request, memory_type: str, filename: str):
     if not file_path:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    # Browsers revalidate (no-cache) and get a 304 while the file is unchanged
+    etag = _file_etag(file_path)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
     
     content = file_path.read_text()
     
@@ -108,7 +183,7 @@ async def edit_memory_form(request: Request, memory_type: str, filename: str):
         "filename": filename,
         "memory_type": memory_type,
         "content": content
-    })
+    }, headers=headers)
 
 
 @router.post("/edit/{memory_type}/{filename}")
@@ -173,32 +248,58 @@ async def create_memory(
     )
 
 
+def _match_context(content: str, q: str) -> str | None:
+    """The first matching line with one line either side, or None if `q` is absent."""
+    q = q.lower()
+    lc = content.lower()
+    idx = lc.find(q)
+    if idx < 0 or "\n" in q:
+        return None
+    if len(lc) != len(content):
+        # lower() changed the length (rare Unicode cases), so offsets don't map back
+        lines = content.split("\n")
+        for i, line in enumerate(lines):
+            if q in line.lower():
+                return "\n".join(lines[max(0,i-1):i+2])[:200]
+        return None
+    # Slice the surrounding lines straight out of content using newline offsets
+    line_start = lc.rfind("\n", 0, idx) + 1
+    start = lc.rfind("\n", 0, line_start - 1) + 1 if line_start else 0
+    line_end = lc.find("\n", idx)
+    end = -1 if line_end < 0 else lc.find("\n", line_end + 1)
+    return content[start:end if end >= 0 else len(content)][:200]
+
+
+def _scan_files() -> list[tuple[str, str, str]]:
+    """Read every file: for queries the index can't answer, or SQLite without FTS5 trigram."""
+    return [
+        (memory_type, name, (MEMORY_DIR / path).read_text())
+        for path, (memory_type, name, _, _) in _memory_index.list_files(MEMORY_DIR).items()
+    ]
+
+
 @router.get("/search", response_class=HTMLResponse)
-async def search_memory(request: Request, q: str = ""):
-    """Search memory files (simple text search)."""
+def search_memory(request: Request, q: str = ""):
+    """Search memory files (sync, so the index refresh and query run in the threadpool)."""
     results = []
     
     if q:
-        for memory_type in ["semantic", "episodic", "procedural"]:
-            dir_path = MEMORY_DIR / memory_type
-            if not dir_path.exists():
-                continue
-            for f in dir_path.glob("*.md"):
-                if f.name.startswith("_"):
-                    continue
-                content = f.read_text()
-                if q.lower() in content.lower():
-                    # Find context around match
-                    lines = content.split("\n")
-                    for i, line in enumerate(lines):
-                        if q.lower() in line.lower():
-                            context = "\n".join(lines[max(0,i-1):i+2])
-                            results.append({
-                                "file": f.name,
-                                "type": memory_type,
-                                "context": context[:200]
-                            })
-                            break
+        hits = None
+        if _memory_index.is_indexable(q):
+            try:
+                hits = _memory_index.search(MEMORY_DIR, q)
+            except sqlite3.OperationalError:
+                pass
+        if hits is None:
+            hits = _scan_files()
+        for memory_type, name, content in hits:
+            context = _match_context(content, q)
+            if context is not None:
+                results.append({
+                    "file": name,
+                    "type": memory_type,
+                    "context": context
+                })
     
     return templates.TemplateResponse("memory/search.html", {
         "request": request,
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # Paths
@@ -13,10 +14,41 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 STATIC_DIR = ROOT_DIR / "static"
 STATIC_DIR.mkdir(exist_ok=True)
 
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZip everything except the chat SSE stream.
+
+    Older Starlette releases also compress text/event-stream, which holds
+    events in the compressor instead of flushing each one to the browser.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/chat/stream":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class _CachedStaticFiles(StaticFiles):
+    """Static files with a browser cache lifetime on top of ETag/Last-Modified.
+
+    Assets are not content-hashed, so the lifetime is short and not `immutable`.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("Cache-Control", "public, max-age=3600")
+        return response
+
+
 app = FastAPI(title="Agent Memory", description="Web interface for memory and agent management")
 
+# HTML pages and HTMX fragments compress well
+app.add_middleware(_GZipMiddleware, minimum_size=500)
+
 # Static files (HTMX, CSS)
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.mount("/static", _CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Import and include routers
 from .routes import dashboard, memory, domains, chat
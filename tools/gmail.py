@@ -9,12 +9,14 @@ Usage:
     python tools/email.py inbox --unread                 # unread only
     python tools/email.py inbox --since 3d               # last 3 days
     python tools/email.py inbox --since 1w               # last week
+    python tools/email.py inbox --since all              # whole mailbox
     python tools/email.py inbox --from "linkedin"        # from address contains
     python tools/email.py inbox --subject "invitation"   # subject contains
     python tools/email.py inbox --unread --since 1d      # combine filters
 
     python tools/email.py read <message_id>              # read full email body
     python tools/email.py read <message_id> --raw        # raw text (no truncation)
+    python tools/email.py read <message_id> --label Jobs # ID from `inbox --label Jobs`
 
     python tools/email.py search "job opportunity"       # full-text search via IMAP
 
@@ -22,12 +24,14 @@ All commands output structured text for easy agent consumption.
 """
 
 import argparse
+import atexit
 import email
 import email.header
 import email.utils
 import imaplib
 import os
 import re
+import sqlite3
 import sys
 from datetime import datetime, timedelta
 from html.parser import HTMLParser
@@ -35,6 +39,12 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    # `fast` extra; selectolax 1.0 removed the old selectolax.parser backend
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:  # optional: the stdlib HTMLParser below is used as a fallback
+    _FastHTMLParser = None
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 GMAIL_ADDRESS = os.environ.get("GMAIL_ADDRESS", "")
@@ -42,6 +52,16 @@ GMAIL_APP_PASSWORD = os.environ.get("GMAIL_APP_PASSWORD", "")
 IMAP_HOST = "imap.gmail.com"
 IMAP_PORT = 993
 MAX_BODY_LENGTH = 3000
+# Window for an unfiltered inbox listing; `--since all` searches the whole mailbox
+DEFAULT_SINCE = "30d"
+# Wider windows tried in turn when DEFAULT_SINCE holds fewer than --limit messages
+WIDEN_SINCE = ("90d", "365d", "all")
+CACHE_PATH = Path.home() / ".cache" / "applyops" / "gmail" / "cache.sqlite"
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r" {2,}")
+_UID_RE = re.compile(rb"\bUID (\d+)")
+_ESEARCH_ALL_RE = re.compile(rb"\bALL (\S+)")
 
 
 class HTMLStripper(HTMLParser):
@@ -57,12 +77,17 @@ class HTMLStripper(HTMLParser):
 
 
 def strip_html(html: str) -> str:
-    s = HTMLStripper()
-    s.feed(html)
-    text = s.get_text()
+    if _FastHTMLParser is not None:
+        # C tokenizer; text nodes are joined the same way HTMLStripper joins them
+        root = _FastHTMLParser(html).root
+        text = root.text() if root is not None else ""
+    else:
+        s = HTMLStripper()
+        s.feed(html)
+        text = s.get_text()
     # Collapse whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r" {2,}", " ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    text = _SPACES_RE.sub(" ", text)
     return text.strip()
 
 
@@ -100,13 +125,36 @@ def parse_since(value: str) -> datetime:
     return datetime.now() - delta
 
 
+_conn: imaplib.IMAP4_SSL | None = None
+
+
+def _logout():
+    global _conn
+    if _conn is not None:
+        try:
+            _conn.logout()
+        except (imaplib.IMAP4.error, OSError):
+            pass
+        _conn = None
+
+
 def connect() -> imaplib.IMAP4_SSL:
+    """Logged-in IMAP connection, reused for the rest of the process."""
+    global _conn
+    if _conn is not None:
+        return _conn
     if not GMAIL_ADDRESS or not GMAIL_APP_PASSWORD:
         print("Error: GMAIL_ADDRESS and GMAIL_APP_PASSWORD must be set in .env")
         sys.exit(1)
 
     conn = imaplib.IMAP4_SSL(IMAP_HOST, IMAP_PORT)
     conn.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
+    # Servers usually advertise more (e.g. ESEARCH) once authenticated
+    _, caps = conn.response("CAPABILITY")
+    if caps and caps[-1]:
+        conn.capabilities = tuple(caps[-1].decode().upper().split())
+    _conn = conn
+    atexit.register(_logout)
     return conn
 
 
@@ -123,7 +171,7 @@ def build_search_criteria(
 
     if unread:
         criteria.append("UNSEEN")
-    if since:
+    if since and since != "all":
         dt = parse_since(since)
         date_str = dt.strftime("%d-%b-%Y")
         criteria.append(f'SINCE {date_str}')
@@ -137,23 +185,61 @@ def build_search_criteria(
     return " ".join(criteria) if criteria else "ALL"
 
 
+def _expand_seqset(seqset: bytes, limit: int | None = None) -> list[bytes]:
+    """Expand an IMAP sequence set like b'1:3,7' into [b'1', b'2', b'3', b'7'].
+
+    With `limit`, only the highest `limit` UIDs are expanded, walking the set
+    from the end.
+    """
+    ranges = []
+    for part in seqset.split(b","):
+        lo, _, hi = part.partition(b":")
+        ranges.append(sorted((int(lo), int(hi or lo))))
+    ranges.sort()
+    uids = []
+    for lo, hi in reversed(ranges):
+        if limit is not None:
+            lo = max(lo, hi - (limit - len(uids)) + 1)
+        uids.extend(range(hi, lo - 1, -1))
+        if limit is not None and len(uids) >= limit:
+            break
+    return [str(n).encode() for n in reversed(uids)]
+
+
+def search_uids(conn: imaplib.IMAP4_SSL, criteria: str, limit: int | None = None) -> list[bytes]:
+    """UIDs matching criteria, ascending; with `limit`, only the latest `limit`."""
+    if "ESEARCH" in conn.capabilities:
+        # RFC 4731 replies with a compact sequence set instead of every UID
+        conn.uid("SEARCH", "RETURN", "(ALL)", criteria)
+        _, data = conn.response("ESEARCH")
+        match = _ESEARCH_ALL_RE.search(data[-1]) if data and data[-1] else None
+        return _expand_seqset(match.group(1), limit) if match else []
+    _, data = conn.uid("SEARCH", None, criteria)
+    uids = data[0].split()
+    return uids[-limit:] if limit is not None else uids
+
+
 def get_body(msg: email.message.Message) -> str:
     """Extract readable text from email message."""
     if msg.is_multipart():
+        # Plain parts first: the HTML alternative is only decoded and stripped
+        # when the message has no usable text/plain part
         text_parts = []
         for part in msg.walk():
-            content_type = part.get_content_type()
-            if content_type == "text/plain":
+            if part.get_content_type() == "text/plain":
                 payload = part.get_payload(decode=True)
                 if payload:
                     charset = part.get_content_charset() or "utf-8"
                     text_parts.append(payload.decode(charset, errors="replace"))
-            elif content_type == "text/html" and not text_parts:
+        if text_parts:
+            return "\n".join(text_parts)
+        for part in msg.walk():
+            if part.get_content_type() == "text/html":
                 payload = part.get_payload(decode=True)
                 if payload:
                     charset = part.get_content_charset() or "utf-8"
-                    text_parts.append(strip_html(payload.decode(charset, errors="replace")))
-        return "\n".join(text_parts)
+                    return strip_html(payload.decode(charset, errors="replace"))
+        return ""
     else:
         payload = msg.get_payload(decode=True)
         if payload:
@@ -182,52 +268,118 @@ def format_email_summary(msg_id: str, msg: email.message.Message) -> str:
     return f"[{msg_id}] {date_str} | {from_addr}\n  Subject: {subject}"
 
 
+def fetch_headers(conn: imaplib.IMAP4_SSL, uids: list[bytes]) -> list[tuple[bytes, email.message.Message]]:
+    """Fetch headers for uids in one round trip, returned in uids order."""
+    _, resp = conn.uid("FETCH", b",".join(uids), "(RFC822.HEADER)")
+    # Parts are (b'<seq> (UID <uid> RFC822.HEADER {n}', raw) tuples, each followed by
+    # a closing b')' item; some servers send UID after the literal, in that item
+    headers = {}
+    for i, part in enumerate(resp):
+        if not isinstance(part, tuple):
+            continue
+        m = _UID_RE.search(part[0])
+        if m is None and i + 1 < len(resp) and isinstance(resp[i + 1], bytes):
+            m = _UID_RE.search(resp[i + 1])
+        if m is not None:
+            headers[m.group(1)] = part[1]
+    return [(uid, email.message_from_bytes(headers[uid])) for uid in uids if uid in headers]
+
+
+def _summary_cache() -> sqlite3.Connection | None:
+    """On-disk summaries keyed by (mailbox, UIDVALIDITY, UID); None if unusable."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        cache = sqlite3.connect(CACHE_PATH)
+        cache.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "mailbox TEXT, uidvalidity INTEGER, uid INTEGER, summary TEXT, "
+            "PRIMARY KEY (mailbox, uidvalidity, uid)) WITHOUT ROWID"
+        )
+        return cache
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def print_summaries(conn: imaplib.IMAP4_SSL, mailbox: str, uids: list[bytes]):
+    """Print summaries for uids, fetching only those not already cached.
+
+    UIDs are stable for a mailbox as long as its UIDVALIDITY is unchanged,
+    so headers seen once never need to be downloaded again.
+    """
+    _, validity = conn.response("UIDVALIDITY")
+    key = (mailbox, int(validity[0]) if validity and validity[0] else 0)
+    cache = _summary_cache()
+    summaries = {}
+    if cache is not None:
+        marks = ",".join("?" * len(uids))
+        summaries = {
+            str(uid).encode(): summary for uid, summary in cache.execute(
+                f"SELECT uid, summary FROM summaries WHERE mailbox = ? AND uidvalidity = ? AND uid IN ({marks})",
+                (*key, *(int(u) for u in uids)),
+            )
+        }
+    missing = [u for u in uids if u not in summaries]
+    if missing:
+        fetched = {uid: format_email_summary(uid.decode(), msg) for uid, msg in fetch_headers(conn, missing)}
+        summaries.update(fetched)
+        if cache is not None:
+            with cache:
+                cache.executemany(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                    [(*key, int(uid), summary) for uid, summary in fetched.items()],
+                )
+    if cache is not None:
+        cache.close()
+    for uid in uids:
+        if uid in summaries:
+            print(summaries[uid])
+            print()
+
+
 def cmd_inbox(args):
     """List emails from inbox."""
     conn = connect()
     mailbox = args.label or "INBOX"
     conn.select(mailbox, readonly=True)
 
+    # With no filters, only ask the server for recent mail
+    windowed = not (args.since or args.unread or getattr(args, "from") or args.subject)
     criteria = build_search_criteria(
         unread=args.unread,
-        since=args.since,
+        since=DEFAULT_SINCE if windowed else args.since,
         from_addr=getattr(args, "from"),
         subject=args.subject,
     )
 
-    _, data = conn.search(None, criteria)
-    msg_ids = data[0].split()
+    msg_ids = search_uids(conn, criteria, args.limit)
+    if windowed:
+        # Quiet mailbox: widen step by step so the latest N are still listed
+        for since in WIDEN_SINCE:
+            if len(msg_ids) >= args.limit:
+                break
+            criteria = build_search_criteria(since=since)
+            msg_ids = search_uids(conn, criteria, args.limit)
 
     if not msg_ids:
         print("No emails found matching criteria.")
-        conn.logout()
         return
 
-    # Get latest N
-    msg_ids = msg_ids[-args.limit:]
+    # Latest first
     msg_ids.reverse()
 
     print(f"Found {len(msg_ids)} email(s) ({mailbox}, {criteria}):\n")
-
-    for mid in msg_ids:
-        _, msg_data = conn.fetch(mid, "(RFC822.HEADER)")
-        raw = msg_data[0][1]
-        msg = email.message_from_bytes(raw)
-        print(format_email_summary(mid.decode(), msg))
-        print()
-
-    conn.logout()
+    print_summaries(conn, mailbox, msg_ids)
 
 
 def cmd_read(args):
     """Read a full email by message ID."""
     conn = connect()
-    conn.select("INBOX", readonly=True)
+    # UIDs are per mailbox, so read from the one the listing came from
+    conn.select(args.label or "INBOX", readonly=True)
 
-    _, msg_data = conn.fetch(args.message_id.encode(), "(RFC822)")
+    _, msg_data = conn.uid("FETCH", args.message_id, "(RFC822)")
     if not msg_data or not msg_data[0]:
         print(f"Message {args.message_id} not found.")
-        conn.logout()
         return
 
     raw = msg_data[0][1]
@@ -248,8 +400,6 @@ def cmd_read(args):
     print(f"Subject: {subject}")
     print(f"\n{body}")
 
-    conn.logout()
-
 
 def cmd_search(args):
     """Full-text search across emails."""
@@ -261,27 +411,16 @@ def cmd_search(args):
         since=args.since,
     )
 
-    _, data = conn.search(None, criteria)
-    msg_ids = data[0].split()
+    msg_ids = search_uids(conn, criteria, args.limit)
 
     if not msg_ids:
         print(f'No emails matching "{args.query}".')
-        conn.logout()
         return
 
-    msg_ids = msg_ids[-args.limit:]
     msg_ids.reverse()
 
     print(f'Found {len(msg_ids)} email(s) matching "{args.query}":\n')
-
-    for mid in msg_ids:
-        _, msg_data = conn.fetch(mid, "(RFC822.HEADER)")
-        raw = msg_data[0][1]
-        msg = email.message_from_bytes(raw)
-        print(format_email_summary(mid.decode(), msg))
-        print()
-
-    conn.logout()
+    print_summaries(conn, "INBOX", msg_ids)
 
 
 def main():
@@ -292,21 +431,22 @@ def main():
     inbox = sub.add_parser("inbox", help="List emails from inbox")
     inbox.add_argument("--limit", type=int, default=10, help="Max emails to show (default: 10)")
     inbox.add_argument("--unread", action="store_true", help="Unread only")
-    inbox.add_argument("--since", help="Duration: 3d, 1w, 2h")
+    inbox.add_argument("--since", help=f"Duration: 3d, 1w, 2h, or all (default: {DEFAULT_SINCE})")
     inbox.add_argument("--from", dest="from", help="From address contains")
     inbox.add_argument("--subject", help="Subject contains")
     inbox.add_argument("--label", help="Gmail label/folder (default: INBOX)")
 
     # read
     read = sub.add_parser("read", help="Read a full email")
-    read.add_argument("message_id", help="Message ID from inbox listing")
+    read.add_argument("message_id", help="Message ID (UID) from inbox listing")
     read.add_argument("--raw", action="store_true", help="Full body, no truncation")
+    read.add_argument("--label", help="Gmail label/folder the ID was listed from (default: INBOX)")
 
     # search
     search = sub.add_parser("search", help="Full-text search")
     search.add_argument("query", help="Search query")
     search.add_argument("--limit", type=int, default=10, help="Max results (default: 10)")
-    search.add_argument("--since", help="Duration: 3d, 1w, 2h")
+    search.add_argument("--since", help="Duration: 3d, 1w, 2h, or all")
 
     args = parser.parse_args()
 